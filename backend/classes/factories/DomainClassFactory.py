@@ -4,6 +4,7 @@ from classes.domainclasses.TimeStamp import TimeStamp
 from classes.factories.BaseFactoryClass import BaseFactory
 from classes.utilities.RC import RC, E_RC
 from cmn_utils import *
+from functools import lru_cache
 
 class DomainClassFactory(BaseFactory):
     """
@@ -16,6 +17,12 @@ class DomainClassFactory(BaseFactory):
         create(self, model_type: str, **kwargs) -> User | Company | TimeStamp | RC: 
             Creates an instance of the specified domain class type.
     """
+    _domain_classes = {
+        'user': User,
+        'company': Company,
+        'timestamp': TimeStamp,
+    }
+
     def create(self, model_type: str, **kwargs) -> User | Company | TimeStamp | RC:
         """
         Creates an instance of the specified domain class type.
@@ -29,15 +36,22 @@ class DomainClassFactory(BaseFactory):
                 An instance of the specified domain class if successful, 
                 otherwise an RC object indicating an error.
         """
+        domain_class = self._domain_classes.get(model_type)
+        if domain_class is None:
+            return RC(E_RC.RC_INVALID_INPUT, f"{model_type} is an invalid domain class type")
+
         try:
-            if model_type == 'user':
-                return User(**kwargs)
-            elif model_type == 'company':
-                return Company(**kwargs)
-            elif model_type == 'timestamp':
-                return TimeStamp(**kwargs)
-            else:
-                return RC(E_RC.RC_INVALID_INPUT, f"{model_type} is an invalid domain class type")
+            return domain_class(**kwargs)
         except Exception as e:
             print_exception(e)
-            return RC(E_RC.RC_INVALID_INPUT, f"Server Error When Creating Domain Class")
\ No newline at end of file
+            return RC(E_RC.RC_INVALID_INPUT, f"Server Error When Creating Domain Class")
+
+@lru_cache(maxsize=1)
+def get_domain_class_factory() -> DomainClassFactory:
+    """
+    Returns the shared DomainClassFactory instance, creating it on first use.
+
+    Returns:
+        DomainClassFactory: The shared factory.
+    """
+    return DomainClassFactory()
@@ -9,6 +9,7 @@ from cmn_utils import print_exception, datetime2iso, iso2datetime
 from flask_sqlalchemy import SQLAlchemy
 from classes.repositories.BaseRepository import BaseRepository
 from classes.utilities.Permission import E_PERMISSIONS
+from sqlalchemy.orm import joinedload
 
 
 
@@ -24,9 +25,11 @@ class CompanyRepository(BaseRepository):
         get_all_active_companies(self) -> List[Company]: Retrieves all active companies.
         get_all_inactive_companies(self) -> List[Company]: Retrieves all inactive companies.
         get_company_admins(self, company_id: str) -> List[User]: Retrieves the admin users for a given company.
+        get_admins_by_company(self, company_ids: List[str]) -> dict[str, List[User]]: Retrieves the admin users of several companies in one query.
         get_company_by_id(self, company_id: str) -> Company | RC: Retrieves a company by its ID.
         get_company_by_name(self, company_name: str) -> Company: Retrieves a company by its name.
         get_company_users(self, company_id: str) -> List[User]: Retrieves all users belonging to a company.
+        get_users_by_company(self, company_ids: List[str]) -> dict[str, List[User]]: Retrieves the users of several companies in one query.
     """
     def __init__(self, db: SQLAlchemy):
         """
@@ -80,11 +83,33 @@ class CompanyRepository(BaseRepository):
         if not company_id:
             return []
         
-        admins = UserModel.query.filter(UserModel.company_id == company_id, UserModel.permission.in_([E_PERMISSIONS.employer, E_PERMISSIONS.net_admin]), 
-                        UserModel.is_active == True ).all()
+        admins = UserModel.query.options(joinedload(UserModel.company)).filter(UserModel.company_id == company_id, 
+                        UserModel.permission.in_([E_PERMISSIONS.employer, E_PERMISSIONS.net_admin]), UserModel.is_active == True ).all()
         
         return [admin.to_class() for admin in admins]
 
+    def get_admins_by_company(self, company_ids: List[str]) -> dict[str, List[User]]:
+        """
+        Retrieves the admin users of several companies with a single query.
+
+        Args:
+            company_ids (List[str]): The IDs of the companies.
+
+        Returns:
+            dict[str, List[User]]: The admin users of each company, keyed by company ID. Companies without admins are omitted.
+        """
+        if not company_ids:
+            return {}
+
+        admins = UserModel.query.options(joinedload(UserModel.company)).filter(UserModel.company_id.in_(company_ids), 
+                        UserModel.permission.in_([E_PERMISSIONS.employer, E_PERMISSIONS.net_admin]), UserModel.is_active == True ).all()
+
+        admins_by_company: dict[str, List[User]] = {}
+        for admin in admins:
+            user = admin.to_class()
+            admins_by_company.setdefault(user.company_id, []).append(user)
+        return admins_by_company
+
     def get_company_by_id(self, company_id: str) -> Company | RC:
         """
         Retrieves a company by its ID.
@@ -125,8 +150,29 @@ class CompanyRepository(BaseRepository):
         Returns:
             List[User]: A list of users belonging to the company.
         """
-        users: UserModel = UserModel.query.filter_by(company_id=company_id, is_active=True).all()
+        users: UserModel = UserModel.query.options(joinedload(UserModel.company)).filter_by(company_id=company_id, is_active=True).all()
         if users:
             return [user.to_class() for user in users]
         return []
-    
\ No newline at end of file
+
+    def get_users_by_company(self, company_ids: List[str]) -> dict[str, List[User]]:
+        """
+        Retrieves the active users of several companies with a single query.
+
+        Args:
+            company_ids (List[str]): The IDs of the companies.
+
+        Returns:
+            dict[str, List[User]]: The active users of each company, keyed by company ID. Companies without users are omitted.
+        """
+        if not company_ids:
+            return {}
+
+        users = UserModel.query.options(joinedload(UserModel.company)).filter(UserModel.company_id.in_(company_ids),
+                        UserModel.is_active == True).all()
+
+        users_by_company: dict[str, List[User]] = {}
+        for user_model in users:
+            user = user_model.to_class()
+            users_by_company.setdefault(user.company_id, []).append(user)
+        return users_by_company
@@ -1,10 +1,15 @@
 from models import *
-from typing import List
+from typing import List, Iterator
 from cmn_utils import print_exception
 from datetime import datetime
 from classes.domainclasses.TimeStamp import TimeStamp
 from classes.utilities.RC import RC, E_RC
 from classes.repositories.BaseRepository import BaseRepository
+from sqlalchemy import insert, func
+from sqlalchemy.orm import joinedload, contains_eager
+
+# TimeStampModel.user is lazy='raise', so every timestamp query loads the user and its company up front
+_WITH_USER = joinedload(TimeStampModel.user).joinedload(UserModel.company)
 
 
 class TimeStampRepository(BaseRepository):
@@ -15,12 +20,18 @@ class TimeStampRepository(BaseRepository):
     in the database using SQLAlchemy.
 
     Methods:
-        get_all_timestamps(self) -> List[TimeStamp]: Retrieves all timestamps.
+        get_all_timestamps(self) -> Iterator[TimeStamp]: Lazily retrieves all timestamps.
         get_timestamp_by_uuid(self, uuid: str) -> TimeStamp|RC: Retrieves a timestamp by its UUID.
         check_punch_in_status(self, email: str, start_of_day: datetime, end_of_day: datetime) -> bool|RC|None: 
             Checks if a user is currently punched in within a given time range.
+        users_with_open_punch(self, emails: List[str], start_of_day: datetime, end_of_day: datetime) -> set[str]|RC: 
+            Returns which of the given users are punched in within a given time range, using a single query.
         get_range(self, start_date: datetime, end_date: datetime, email: str = None, company_id: str = None) -> list|RC: 
             Retrieves timestamps within a given date range, optionally filtered by email or company ID.
+        work_time_by_user(self, emails: List[str], start_date: datetime, end_date: datetime) -> dict[str, int]|RC: 
+            Sums the work time of several users within a date range with a single aggregate query.
+        bulk_insert(self, timestamps: List[TimeStamp], chunk_size: int = 1000) -> RC: 
+            Inserts many timestamps with chunked executemany statements in one transaction.
     """
     def __init__(self, db: SQLAlchemy):
         """
@@ -31,15 +42,17 @@ class TimeStampRepository(BaseRepository):
         """
         super().__init__(db)
 
-    def get_all_timestamps(self) -> List[TimeStamp]:
+    def get_all_timestamps(self) -> Iterator[TimeStamp]:
         """
-        Retrieves all timestamps from the database.
+        Lazily retrieves all timestamps from the database.
+
+        Rows are fetched from the database in batches of 500 as the result is iterated.
 
         Returns:
-            List[TimeStamp]: A list of all timestamps.
+            Iterator[TimeStamp]: A generator of all timestamps.
         """
-        timestamps = TimeStampModel.query.all()
-        return [timestamp.to_class() for timestamp in timestamps]
+        timestamps = TimeStampModel.query.options(_WITH_USER).yield_per(500)
+        return (timestamp.to_class() for timestamp in timestamps)
 
     def get_timestamp_by_uuid(self, uuid: str) -> TimeStamp|RC:
         """
@@ -51,7 +64,7 @@ class TimeStampRepository(BaseRepository):
         Returns:
             TimeStamp|RC: The TimeStamp object if found, otherwise an RC object indicating an error.
         """
-        timestamp = TimeStampModel.query.get(uuid)
+        timestamp = self.db.session.get(TimeStampModel, uuid, options=[_WITH_USER])
         if timestamp:
             return timestamp.to_class()
         return RC(E_RC.RC_NOT_FOUND, "Time stamp not found")
@@ -75,7 +88,7 @@ class TimeStampRepository(BaseRepository):
         """
         try:
             
-            timestamp: TimeStampModel = TimeStampModel.query.filter(
+            timestamp: TimeStampModel = TimeStampModel.query.options(_WITH_USER).filter(
                 TimeStampModel.user_email == email,
                 TimeStampModel.punch_in_timestamp >= start_of_day,
                 TimeStampModel.punch_in_timestamp <= end_of_day,
@@ -91,6 +104,35 @@ class TimeStampRepository(BaseRepository):
             print_exception(e)
             return RC(E_RC.RC_ERROR_DATABASE, "DB Exception")
         
+    def users_with_open_punch(self, emails: List[str], start_of_day: datetime, end_of_day: datetime) -> set[str]|RC:
+        """
+        Returns which of the given users are currently punched in within a given time range.
+
+        Args:
+            emails (List[str]): The emails of the users to check.
+            start_of_day (datetime): The start of the date range.
+            end_of_day (datetime): The end of the date range.
+
+        Returns:
+            set[str]|RC: The emails that have an open timestamp, or an RC object in case of an error.
+        """
+        if not emails:
+            return set()
+        
+        try:
+            rows = self.db.session.query(TimeStampModel.user_email).filter(
+                TimeStampModel.user_email.in_(emails),
+                TimeStampModel.punch_in_timestamp >= start_of_day,
+                TimeStampModel.punch_in_timestamp <= end_of_day,
+                TimeStampModel.punch_out_timestamp == None
+            ).distinct().all()
+
+            return {row.user_email for row in rows}
+        
+        except Exception as e:
+            print_exception(e)
+            return RC(E_RC.RC_ERROR_DATABASE, "DB Exception")
+        
     def get_range(self, start_date: datetime, end_date: datetime, email: str = None, company_id: str = None) -> list|RC:
         """
         Retrieves timestamps within a given date range, optionally filtered by email or company ID.
@@ -108,18 +150,86 @@ class TimeStampRepository(BaseRepository):
         try:
             
             if company_id is None:
-                timestamps: TimeStampModel= TimeStampModel.query.filter(
+                timestamps: TimeStampModel= TimeStampModel.query.options(_WITH_USER).filter(
                     TimeStampModel.user_email == email,
-                    TimeStampModel.punch_in_timestamp >= start_date,
-                    TimeStampModel.punch_in_timestamp <= end_date
-                ).all()
+                    TimeStampModel.punch_in_timestamp.between(start_date, end_date)
+                ).order_by(TimeStampModel.punch_in_timestamp).all()
             elif company_id is not None:
                 timestamps: TimeStampModel= TimeStampModel.query.filter(TimeStampModel.punch_in_timestamp >= start_date,
-                            TimeStampModel.punch_in_timestamp <= end_date).join(UserModel, TimeStampModel.user_email == UserModel.email)\
-                            .filter(UserModel.company_id == company_id).all()
+                            TimeStampModel.punch_in_timestamp <= end_date).join(TimeStampModel.user)\
+                            .filter(UserModel.company_id == company_id)\
+                            .options(contains_eager(TimeStampModel.user).joinedload(UserModel.company)).all()
                 
             return [timestamp.to_class() for timestamp in timestamps]
                 
         except Exception as e:
             print_exception(e)
-            return RC(E_RC.RC_ERROR_DATABASE, "DB Exception")
\ No newline at end of file
+            return RC(E_RC.RC_ERROR_DATABASE, "DB Exception")
+
+    def work_time_by_user(self, emails: List[str], start_date: datetime, end_date: datetime) -> dict[str, int]|RC:
+        """
+        Sums the work time of several users within a date range with a single aggregate query.
+
+        Uses the same range filter as `get_range` for a single user.
+
+        Args:
+            emails (List[str]): The emails of the users.
+            start_date (datetime): The start of the date range.
+            end_date (datetime): The end of the date range.
+
+        Returns:
+            dict[str, int]|RC: The total work time in seconds of each user, keyed by email. Users without 
+                               timestamps in the range are omitted. An RC object in case of an error.
+        """
+        if not emails:
+            return {}
+        
+        try:
+            rows = self.db.session.query(
+                TimeStampModel.user_email,
+                func.coalesce(func.sum(TimeStampModel.total_work_time), 0)
+            ).filter(
+                TimeStampModel.user_email.in_(emails),
+                TimeStampModel.punch_in_timestamp.between(start_date, end_date)
+            ).group_by(TimeStampModel.user_email).all()
+
+            return {user_email: int(total) for user_email, total in rows}
+        
+        except Exception as e:
+            print_exception(e)
+            return RC(E_RC.RC_ERROR_DATABASE, "DB Exception")
+
+    def bulk_insert(self, timestamps: List[TimeStamp], chunk_size: int = 1000) -> RC:
+        """
+        Inserts many timestamps using one executemany statement per chunk.
+
+        All chunks are committed in a single transaction, so either every timestamp is inserted or none is.
+
+        Args:
+            timestamps (List[TimeStamp]): The timestamps to insert.
+            chunk_size (int, optional): The number of rows sent per statement. Defaults to 1000.
+
+        Returns:
+            RC: A result code indicating success or failure.
+        """
+        rows = [{
+            'user_email': timestamp.user_email,
+            'entered_by': timestamp.entered_by,
+            'punch_type': timestamp.punch_type,
+            'punch_in_timestamp': timestamp.punch_in_timestamp,
+            'punch_out_timestamp': timestamp.punch_out_timestamp,
+            'reporting_type': timestamp.reporting_type,
+            'detail': timestamp.detail,
+        } for timestamp in timestamps]
+
+        try:
+            statement = insert(TimeStampModel)
+            for start in range(0, len(rows), chunk_size):
+                self.db.session.execute(statement, rows[start:start + chunk_size])
+            self.db.session.commit()
+            return RC(E_RC.RC_OK, f"Succefully Saved {len(rows)} rows to {TimeStampModel.__tablename__} DB")
+        
+        except Exception as e:
+            self.db.session.rollback()
+            print_exception(e)
+            return RC(E_RC.RC_ERROR_DATABASE, "DB Exception")
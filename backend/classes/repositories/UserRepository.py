@@ -1,8 +1,44 @@
 from models import *
 from classes.domainclasses.User import User
-from typing import List
+from typing import List, Iterator
 from classes.utilities.RC import RC, E_RC
 from classes.repositories.BaseRepository import BaseRepository
+from classes.domainclasses.DomainClassInterface import DomainClassInterface
+from flask import g
+from sqlalchemy import select, cast, case, func, literal_column, BigInteger, Float, Text, RowMapping, Select
+from sqlalchemy.orm import selectinload, raiseload
+
+# Users are converted together with their company; any other relationship access raises instead of lazy loading
+_USER_LOAD_OPTIONS = (selectinload(UserModel.company), raiseload('*'))
+
+# Columns returned by the user list endpoints; pass_hash is never selected.
+# Numeric columns are cast to float in SQL, so the driver skips building a Decimal per value.
+_USER_LIST_COLUMNS = (
+    UserModel.email, UserModel.first_name, UserModel.last_name, UserModel.mobile_phone, UserModel.company_id,
+    UserModel.role, UserModel.permission, UserModel.is_active,
+    cast(UserModel.salary, Float).label('salary'), cast(UserModel.work_capacity, Float).label('work_capacity'),
+    UserModel.employment_start, UserModel.employment_end, UserModel.weekend_choice, CompanyModel.company_name,
+)
+
+def _float_str(column):
+    """
+    Renders a numeric column as text the way `str(float(value)) if value else None` does in Python.
+
+    Zero becomes NULL and whole numbers keep a trailing '.0', so Postgres built JSON matches `_user_row_to_dict`.
+    """
+    value = cast(func.nullif(column, 0), Float)
+    return case(
+        (value == func.trunc(value), cast(cast(value, BigInteger), Text) + '.0'),
+        else_=cast(value, Text),
+    )
+
+# The same columns for JSON built by Postgres, formatted like the rows converted by UserService._user_row_to_dict
+_USER_JSON_COLUMNS = (
+    UserModel.email, UserModel.first_name, UserModel.last_name, UserModel.mobile_phone, UserModel.company_id,
+    UserModel.role, UserModel.permission, UserModel.is_active,
+    _float_str(UserModel.salary).label('salary'), _float_str(UserModel.work_capacity).label('work_capacity'),
+    UserModel.employment_start, UserModel.employment_end, UserModel.weekend_choice, CompanyModel.company_name,
+)
 
 
 class UserRepository(BaseRepository):
@@ -13,10 +49,17 @@ class UserRepository(BaseRepository):
     in the database using SQLAlchemy.
 
     Methods:
-        get_active_users(self, company_id: str = None) -> List[User]: Retrieves all active users, optionally filtered by company ID.
-        get_inactive_users(self, company_id: str = None) -> List[User]: Retrieves all inactive users, optionally filtered by company ID.
-        get_users(self, company_id: str = None) -> List[User]: Retrieves all users, optionally filtered by company ID.
-        get_user_by_email(self, email: str) -> User | RC: Retrieves a user by their email address.
+        get_active_users(self, company_id: str = None) -> List[RowMapping]: Retrieves all active users, optionally filtered by company ID.
+        get_active_users_json(self, company_id: str = None) -> str: Retrieves all active users as a JSON array built by the database.
+        get_inactive_users(self, company_id: str = None) -> List[RowMapping]: Retrieves all inactive users, optionally filtered by company ID.
+        get_users(self, company_id: str = None) -> Iterator[RowMapping]: Lazily retrieves all users, optionally filtered by company ID.
+        _user_rows(self, company_id: str = None, *conditions) -> List[RowMapping]: Selects user list columns with the company name in one query.
+        _user_statement(self, company_id: str = None, *conditions) -> Select: Builds the user list statement.
+        get_user_by_email(self, email: str) -> User | RC: Retrieves a user by their email address, cached per request.
+        update(self, data: DomainClassInterface) -> RC: Updates a user and drops it from the request cache.
+        delete(self, data: DomainClassInterface) -> RC: Deletes a user and drops it from the request cache.
+        _forget_user(self, data: DomainClassInterface) -> None: Removes a user from the request cache.
+        get_users_by_emails(self, emails: List[str]) -> dict[str, User]: Retrieves several users by email in one query.
     """
     def __init__(self, db: SQLAlchemy):
         """
@@ -27,7 +70,7 @@ class UserRepository(BaseRepository):
         """
         super().__init__(db)
 
-    def get_active_users(self, company_id: str = None) -> List[User]:
+    def get_active_users(self, company_id: str = None) -> List[RowMapping]:
         """
         Retrieves all active users, optionally filtered by company ID.
 
@@ -35,27 +78,35 @@ class UserRepository(BaseRepository):
             company_id (str, optional): The ID of the company to filter by. Defaults to None.
 
         Returns:
-            List[User]: A list of active users.
-        """
-        if not company_id:
-            active_users: list[User] = (
-                self.db.session.query(UserModel)
-                .filter(UserModel.is_active == True)
-                .all()
-            )
-        else:
-            active_users: list[User] = (
-                self.db.session.query(UserModel)
-                .filter(
-                    UserModel.is_active == True,  
-                    UserModel.company_id == company_id  
-                )
-                .all()
-            )
-         
-        return [user.to_class() for user in active_users]
+            List[RowMapping]: The active users' list columns, including their company name.
+        """
+        return self._user_rows(company_id, UserModel.is_active == True)
     
-    def get_inactive_users(self, company_id: str = None) -> List[User]:
+    def get_active_users_json(self, company_id: str = None) -> str:
+        """
+        Retrieves all active users, optionally filtered by company ID, as a JSON array encoded by Postgres.
+
+        The rows are aggregated with json_agg in a single query, so no row is built or serialized in Python.
+
+        Args:
+            company_id (str, optional): The ID of the company to filter by. Defaults to None.
+
+        Returns:
+            str: A JSON array of the active users' list columns, including their company name.
+        """
+        users = (
+            select(*_USER_JSON_COLUMNS)
+            .outerjoin(CompanyModel, UserModel.company_id == CompanyModel.company_id)
+            .where(UserModel.is_active == True)
+        )
+        if company_id:
+            users = users.where(UserModel.company_id == company_id)
+        users = users.subquery('u')
+
+        statement = select(cast(func.coalesce(func.json_agg(users.table_valued()), literal_column("'[]'::json")), Text))
+        return self.db.session.execute(statement).scalar_one()
+    
+    def get_inactive_users(self, company_id: str = None) -> List[RowMapping]:
         """
         Retrieves all inactive users, optionally filtered by company ID.
 
@@ -63,64 +114,128 @@ class UserRepository(BaseRepository):
             company_id (str, optional): The ID of the company to filter by. Defaults to None.
 
         Returns:
-            List[User]: A list of inactive users.
-        """
-        if not company_id:
-            active_users: list[User] = (
-                self.db.session.query(UserModel)
-                .filter(UserModel.is_active == False)
-                .all()
-            )
-        else:
-            active_users: list[User] = (
-                self.db.session.query(UserModel, CompanyModel)
-                .filter(
-                    UserModel.is_active == False,  
-                    CompanyModel.company_id == company_id  
-                )
-                .all()
-            )
-         
-        return [user.to_class() for user in active_users]
+            List[RowMapping]: The inactive users' list columns, including their company name.
+        """
+        return self._user_rows(company_id, UserModel.is_active == False)
     
-    def get_users(self, company_id: str = None) -> List[User]:
+    def get_users(self, company_id: str = None) -> Iterator[RowMapping]:
+        """
+        Lazily retrieves all users, optionally filtered by company ID.
+
+        Rows are fetched through a server side cursor in batches of 500 as the result is iterated.
+
+        Args:
+            company_id (str, optional): The ID of the company to filter by. Defaults to None.
+
+        Returns:
+            Iterator[RowMapping]: The users' list columns, including their company name.
+        """
+        statement = self._user_statement(company_id).execution_options(yield_per=500)
+        return self.db.session.execute(statement).mappings()
+
+    def _user_rows(self, company_id: str = None, *conditions) -> List[RowMapping]:
+        """
+        Selects the list columns of users joined with their company name, as plain rows.
+
+        Skips ORM object hydration and the conversion to domain objects, which list endpoints do not need.
+
+        Args:
+            company_id (str, optional): The ID of the company to filter by. Defaults to None.
+            *conditions: Additional filter conditions.
+
+        Returns:
+            List[RowMapping]: The selected rows.
         """
-        Retrieves all users, optionally filtered by company ID.
+        return self.db.session.execute(self._user_statement(company_id, *conditions)).mappings().all()
+
+    def _user_statement(self, company_id: str = None, *conditions) -> Select:
+        """
+        Builds the select of the users' list columns joined with their company name.
 
         Args:
             company_id (str, optional): The ID of the company to filter by. Defaults to None.
+            *conditions: Additional filter conditions.
 
         Returns:
-            List[User]: A list of all users.
-        """
-        if not company_id:
-            active_users: list[User] = (
-                self.db.session.query(UserModel)
-                .all()
-            )
-        else:
-            active_users: list[User] = (
-                self.db.session.query(UserModel, CompanyModel)
-                .filter(
-                    CompanyModel.company_id == company_id  
-                )
-                .all()
-            )
-         
-        return [user.to_class() for user in active_users]
+            Select: The user list statement.
+        """
+        statement = (
+            select(*_USER_LIST_COLUMNS)
+            .outerjoin(CompanyModel, UserModel.company_id == CompanyModel.company_id)
+            .where(*conditions)
+        )
+        if company_id:
+            statement = statement.where(UserModel.company_id == company_id)
+        return statement
 
     def get_user_by_email(self, email: str) -> User | RC:
         """
         Retrieves a user by their email address.
 
+        Found users are cached on `flask.g`, so later lookups of the same user in the same request
+        skip the query and the conversion to a domain object.
+
         Args:
             email (str): The email address of the user.
 
         Returns:
             User | RC: The User object if found, otherwise an RC object indicating an error.
         """
-        user: UserModel = UserModel.query.get(email)
+        user_cache: dict = g.setdefault('user_cache', {})
+        cached_user = user_cache.get(email)
+        if cached_user is not None:
+            return cached_user
+        
+        user: UserModel = self.db.session.get(UserModel, email, options=_USER_LOAD_OPTIONS)
         if user:
-            return user.to_class()
+            user_cache[email] = user.to_class()
+            return user_cache[email]
         return RC(E_RC.RC_NOT_FOUND, f"User not found for: {email}")
-    
\ No newline at end of file
+
+    def update(self, data: DomainClassInterface) -> RC:
+        """
+        Updates a user and drops it from the request cache.
+
+        Args:
+            data (DomainClassInterface): The user to update.
+
+        Returns:
+            RC: A result code indicating success or failure.
+        """
+        self._forget_user(data)
+        return super().update(data)
+
+    def delete(self, data: DomainClassInterface) -> RC:
+        """
+        Deletes a user and drops it from the request cache.
+
+        Args:
+            data (DomainClassInterface): The user to delete.
+
+        Returns:
+            RC: A result code indicating success or failure.
+        """
+        self._forget_user(data)
+        return super().delete(data)
+
+    def _forget_user(self, data: DomainClassInterface) -> None:
+        """Removes a user from the request cache."""
+        email = getattr(data, 'email', None)
+        if email is not None:
+            g.get('user_cache', {}).pop(email, None)
+
+    def get_users_by_emails(self, emails: List[str]) -> dict[str, User]:
+        """
+        Retrieves several users by their email addresses with a single query.
+
+        Args:
+            emails (List[str]): The email addresses of the users.
+
+        Returns:
+            dict[str, User]: The found users, keyed by email. Emails without a user are omitted.
+        """
+        if not emails:
+            return {}
+
+        users = UserModel.query.options(*_USER_LOAD_OPTIONS).filter(UserModel.email.in_(emails)).all()
+        return {user.email: user.to_class() for user in users}
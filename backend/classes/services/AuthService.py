@@ -5,8 +5,8 @@ from classes.repositories.UserRepository import UserRepository
 from classes.validators.ModelValidator import ModelValidator
 from classes.services.BaseServiceClass import BaseService
 from classes.factories.DomainClassFactory import DomainClassFactory
+from classes.utilities.PasswordHasher import PasswordHasherInterface
 from cmn_utils import *
-import bcrypt
 
 
 class AuthService(BaseService):
@@ -22,7 +22,7 @@ class AuthService(BaseService):
         refresh(self, current_user: str) -> tuple[str, str] | RC: 
             Refreshes an access token for a logged-in user.
     """
-    def __init__(self, user_repository: UserRepository, validator: ModelValidator, factory: DomainClassFactory):
+    def __init__(self, user_repository: UserRepository, validator: ModelValidator, factory: DomainClassFactory, password_hasher: PasswordHasherInterface):
         """
         Initializes the AuthService with necessary dependencies.
 
@@ -30,9 +30,11 @@ class AuthService(BaseService):
             user_repository (UserRepository): An instance of the UserRepository for user data access.
             validator (ModelValidator): An instance of the ModelValidator for data validation.
             factory (DomainClassFactory): An instance of the DomainClassFactory for creating domain objects.
+            password_hasher (PasswordHasherInterface): The password hasher used to verify credentials.
         """
         super().__init__(validator, factory)
         self.user_repository = user_repository
+        self.password_hasher = password_hasher
 
     def login(self, email: str, password: str) -> tuple[str, str] | RC:
         """
@@ -54,7 +56,7 @@ class AuthService(BaseService):
             if not user.pass_hash:
                 return RC(E_RC.RC_INVALID_INPUT, 'Password not set for this user')
 
-            if not bcrypt.checkpw(password.encode('utf-8'), user.pass_hash.encode('utf-8')):
+            if not self.password_hasher.verify(password, user.pass_hash):
                 return RC(E_RC.RC_INVALID_INPUT, 'Invalid credentials')
 
             additional_claims = {
@@ -6,6 +6,9 @@ from classes.utilities.Permission import Permission
 from classes.services.BaseServiceClass import BaseService
 from classes.validators.ModelValidator import ModelValidator
 from classes.factories.DomainClassFactory import DomainClassFactory
+from typing import Iterator
+from cachetools import TTLCache
+import threading
 
 class CompanyService(BaseService):
     """
@@ -18,12 +21,15 @@ class CompanyService(BaseService):
         create_company(self, company_name: str, user_permission: int) -> RC: Creates a new company.
         update_company(self, company_id: str, company_name: str, user_permission: int) -> RC: Updates an existing company.
         delete_company(self, company_id: str, user_permission: int) -> RC: Deactivates a company.
-        get_active_companies(self, user_permission: int) -> list: Retrieves all active companies.
-        get_all_companies(self, user_permission: int) -> list: Retrieves all companies (active and inactive).
-        get_company_users(self, company_id: str, user_permission: int, user_company_id) -> list: Retrieves users belonging to a company.
+        get_active_companies(self, user_permission: int) -> Iterator[dict] | RC: Retrieves all active companies.
+        get_all_companies(self, user_permission: int) -> Iterator[dict] | RC: Retrieves all companies (active and inactive).
+        get_company_users(self, company_id: str, user_permission: int, user_company_id) -> Iterator[dict] | RC: Retrieves users belonging to a company.
         get_company_details(self, company_id: str, user_company_id: str, user_permission: int) -> dict | RC: Retrieves details of a company.
         get_company_admins(self, company_id: str, user_company_id: str, user_permission: int) -> list | RC: Retrieves admin users of a company.
         get_company_name_by_id(self, company_id: str, user_company_id: str, user_permission: int) -> dict | RC: Retrieves the name of a company by ID.
+        _companies_with_admin(self, companies: list[Company]) -> Iterator[dict]: Converts companies to dictionaries including their admin user.
+        _get_company_name_cached(self, company_id: str) -> str | RC: Retrieves a company name by ID through the TTL cache.
+        _invalidate_company(self, company_id: str) -> None: Removes a company from this worker's TTL cache.
     """
     def __init__(self, company_repository: CompanyRepository, validator: ModelValidator, factory: DomainClassFactory):
         """
@@ -36,6 +42,8 @@ class CompanyService(BaseService):
         """
         super().__init__(validator, factory)
         self.company_repository = company_repository
+        self._company_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+        self._company_cache_lock = threading.Lock()
 
     def create_company(self, company_name: str, user_permission: int) -> RC:
         """
@@ -102,7 +110,9 @@ class CompanyService(BaseService):
 
         company.company_name = company_name
         
-        return self._update(self.company_repository, company)  
+        rc: RC = self._update(self.company_repository, company)
+        self._invalidate_company(company_id)
+        return rc
 
     def delete_company(self, company_id: str, user_permission: int) -> RC:
         """
@@ -129,9 +139,11 @@ class CompanyService(BaseService):
 
         company.is_active = False
         
-        return self._update(self.company_repository, company)
+        rc: RC = self._update(self.company_repository, company)
+        self._invalidate_company(company_id)
+        return rc
 
-    def get_active_companies(self, user_permission: int) -> list:
+    def get_active_companies(self, user_permission: int) -> Iterator[dict] | RC:
         """
         Retrieves all active companies.
 
@@ -139,7 +151,7 @@ class CompanyService(BaseService):
             user_permission (int): The permission level of the user initiating the request.
 
         Returns:
-            list: A list of dictionaries, each containing information about an active company.
+            Iterator[dict] | RC: A generator of dictionaries, each containing information about an active company.
         """
         perm: Permission = Permission(user_permission)
         if isinstance(perm, RC):
@@ -149,17 +161,9 @@ class CompanyService(BaseService):
             return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
         
         active_companies = self.company_repository.get_all_active_companies()
+        return self._companies_with_admin(active_companies)
 
-        company_data = []
-        for company in active_companies:
-            company_dict = company.to_dict()
-            admins = self.company_repository.get_company_admins(company.company_id)
-            company_dict['admin_user'] = admins[0].to_dict() if admins else None
-            company_data.append(company_dict)
-
-        return company_data
-
-    def get_all_companies(self, user_permission: int) -> list:
+    def get_all_companies(self, user_permission: int) -> Iterator[dict] | RC:
         """
         Retrieves all companies (active and inactive).
 
@@ -167,7 +171,7 @@ class CompanyService(BaseService):
             user_permission (int): The permission level of the user initiating the request.
 
         Returns:
-            list: A list of dictionaries, each containing information about a company.
+            Iterator[dict] | RC: A generator of dictionaries, each containing information about a company.
         """
         perm: Permission = Permission(user_permission)
         if isinstance(perm, RC):
@@ -177,17 +181,9 @@ class CompanyService(BaseService):
             return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
         
         all_companies = self.company_repository.get_all_companies()
+        return self._companies_with_admin(all_companies)
 
-        company_data = []
-        for company in all_companies:
-            company_dict = company.to_dict()
-            admins = self.company_repository.get_company_admins(company.company_id)
-            company_dict['admin_user'] = admins[0].to_dict() if admins else None
-            company_data.append(company_dict)
-
-        return company_data
-
-    def get_company_users(self, company_id: str, user_permission: int, user_company_id) -> list:
+    def get_company_users(self, company_id: str, user_permission: int, user_company_id) -> Iterator[dict] | RC:
         """
         Retrieves users belonging to a company.
 
@@ -197,7 +193,7 @@ class CompanyService(BaseService):
             user_company_id (str): The company ID of the user initiating the request.
 
         Returns:
-            list: A list of dictionaries, each containing information about a user.
+            Iterator[dict] | RC: A generator of dictionaries, each containing information about a user.
         """
         perm: Permission = Permission(user_permission)
         if isinstance(perm, RC):
@@ -214,7 +210,7 @@ class CompanyService(BaseService):
             return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
         
         users = self.company_repository.get_company_users(company_id=company_id)
-        return [user.to_dict() for user in users]
+        return (user.to_dict() for user in users)
 
     def get_company_details(self, company_id: str, user_company_id: str, user_permission: int) -> dict | RC:
         """
@@ -232,7 +228,7 @@ class CompanyService(BaseService):
         if isinstance(perm, RC):
             return perm
         
-        company: Company = self.company_repository.get_company_by_id(company_id=company_id)
+        company: Company = self.company_repository.get_company_by_id(company_id)
         if isinstance(company, RC):
             return company
 
@@ -295,9 +291,9 @@ class CompanyService(BaseService):
         if isinstance(perm, RC):
             return perm
         
-        company = self.company_repository.get_company_by_id(company_id)
-        if isinstance(company, RC):
-            return company
+        company_name = self._get_company_name_cached(company_id)
+        if isinstance(company_name, RC):
+            return company_name
 
         if perm.is_employee() and user_company_id != company_id:
             return RC(E_RC.RC_UNAUTHORIZED, 'Unauthorized to access this information')
@@ -305,4 +301,59 @@ class CompanyService(BaseService):
         if perm.is_employer() and user_company_id != company_id:
             return RC(E_RC.RC_UNAUTHORIZED, 'Unauthorized to access this information')
 
-        return {'company_name': company.company_name}
\ No newline at end of file
+        return {'company_name': company_name}
+
+    def _companies_with_admin(self, companies: list[Company]) -> Iterator[dict]:
+        """
+        Lazily converts companies to dictionaries, adding the first admin user of each company.
+
+        Args:
+            companies (list[Company]): The companies to convert.
+
+        Yields:
+            dict: A dictionary containing company information and its 'admin_user'.
+        """
+        admins_by_company = self.company_repository.get_admins_by_company([company.company_id for company in companies])
+        for company in companies:
+            company_dict = company.to_dict()
+            admins = admins_by_company.get(company.company_id)
+            company_dict['admin_user'] = admins[0].to_dict() if admins else None
+            yield company_dict
+
+    def _get_company_name_cached(self, company_id: str) -> str | RC:
+        """
+        Retrieves a company name by ID, caching found names for 5 minutes.
+
+        The cache belongs to one worker process, and only the worker that handles a rename invalidates it,
+        so other workers may return the previous name for up to 5 minutes. That staleness is accepted for
+        display names only; company details and the active flag are always read from the database.
+        Only the lookup is cached; authorization is still checked by the caller on every request.
+
+        Args:
+            company_id (str): The ID of the company.
+
+        Returns:
+            str | RC: The company name if found, otherwise an RC object indicating an error.
+        """
+        with self._company_cache_lock:
+            company_name = self._company_cache.get(company_id)
+        if company_name is not None:
+            return company_name
+
+        company = self.company_repository.get_company_by_id(company_id)
+        if isinstance(company, RC):
+            return company
+        
+        with self._company_cache_lock:
+            self._company_cache[company_id] = company.company_name
+        return company.company_name
+
+    def _invalidate_company(self, company_id: str) -> None:
+        """
+        Removes a company from this worker's TTL cache after it was changed.
+
+        Args:
+            company_id (str): The ID of the company.
+        """
+        with self._company_cache_lock:
+            self._company_cache.pop(company_id, None)
@@ -11,7 +11,7 @@ from classes.factories.DomainClassFactory import DomainClassFactory
 from classes.utilities.RC import RC, E_RC
 from cmn_utils import *
 from datetime import datetime, timezone, timedelta
-import calendar
+from typing import Iterator
 
 
 class ReportService(BaseService):
@@ -28,7 +28,7 @@ from classes.factories.DomainClassFactory import DomainClassFactory
 from classes.utilities.RC import RC, E_RC
 from cmn_utils import *
 from datetime import datetime, timezone, timedelta
-import calendar
+from typing import Iterator
 
 
 class ReportService(BaseService):
@@ -41,18 +41,24 @@ class ReportService(BaseService):
     to ensure that users can only access reports they are permitted to see.
 
     Methods:
-        user_report(self, user_email, date_range_type, selected_year, selected_month, start_date_str, 
-                    end_date_str, user_permission: int, user_company_id: str, current_user_email: str) -> dict | RC: 
+        user_report(self, user_email: str, start_date: datetime, end_date: datetime, user_permission: int, 
+                    user_company_id: str, current_user_email: str) -> dict | RC: 
                     Generates a report for a specific user.
                     
-        company_summary(self, company_id: str, date_range_type: str, selected_year: str, selected_month: str, start_date_str: str, 
-                        end_date_str: str, user_permission: int, user_company_id: str) -> dict|RC: 
+        company_summary(self, company_id: str, start_date: datetime, end_date: datetime, user_permission: int, 
+                        user_company_id: str) -> Iterator[dict]|RC: 
                         Generates a summary report for a specific company.
                         
-        company_overview(self, date_range_type: str, selected_year: str, selected_month: str, start_date_str: str, 
-                        end_date_str: str, user_permission: int) -> dict| RC: 
+        company_overview(self, start_date: datetime, end_date: datetime, user_permission: int) -> Iterator[dict]| RC: 
                         Generates an overview report for all companies.
 
+        _company_summary_rows(self, company_id: str, start_date: datetime, end_date: datetime) -> Iterator[dict]: 
+                        Lazily generates the company summary report entries.
+
+        _company_overview_rows(self, companies: list[Company], admins_by_company: dict, employees_by_company: dict, 
+                               work_time_by_user: dict) -> Iterator[dict]: 
+                        Lazily generates the company overview report entries from prefetched data.
+
         _calculate_work_days(self, user: User, time_stamps: list[TimeStamp], start_date: datetime, end_date: datetime) -> tuple: 
                         Calculates the number of days worked, paid days off, unpaid days off, and other relevant metrics for a user within a date range.
 
@@ -60,9 +66,6 @@ class ReportService(BaseService):
                                 potential_work_days, start_date, end_date, daily_breakdown = None) -> dict|RC: 
                                 Generates a report entry for a user, including their work details and calculated salary.
 
-        _set_dates_range(self, date_range_type: str, selected_year: str, selected_month: str, start_date_str: str, end_date_str: str) -> tuple|RC: 
-                        Sets the start and end dates for the report based on the selected date range type.
-
         _calculate_salary(self, total_hours_worked: float|str, salary: float|str) -> float: 
                         Calculates the salary for a user based on their total hours worked and hourly salary.
     """
@@ -82,8 +85,8 @@ class ReportService(BaseService):
         self.timestamp_repository: TimeStampRepository = timestamp_repository
         self.company_repository: CompanyRepository = company_repository
 
-    def user_report(self, user_email, date_range_type, selected_year, selected_month, start_date_str, \
-            end_date_str, user_permission: int, user_company_id: str, current_user_email: str) -> dict | RC:
+    def user_report(self, user_email: str, start_date: datetime, end_date: datetime, user_permission: int, \
+            user_company_id: str, current_user_email: str) -> dict | RC:
         """
         Generates a report for a specific user.
 
@@ -92,12 +95,9 @@ class ReportService(BaseService):
         It then generates a report entry with this information, including a daily breakdown of hours worked.
 
         Args:
-            user_email: The email of the user for whom the report is generated.
-            date_range_type: The type of date range selection ('monthly' or 'custom').
-            selected_year: The year selected for the report (if date_range_type is 'monthly').
-            selected_month: The month selected for the report (if date_range_type is 'monthly').
-            start_date_str: The start date of the custom date range (if date_range_type is 'custom').
-            end_date_str: The end date of the custom date range (if date_range_type is 'custom').
+            user_email (str): The email of the user for whom the report is generated.
+            start_date (datetime): The start date of the report range.
+            end_date (datetime): The end date of the report range.
             user_permission (int): The permission level of the user initiating the request.
             user_company_id (str): The company ID of the user initiating the request.
             current_user_email (str): The email of the currently logged-in user.
@@ -112,12 +112,6 @@ class ReportService(BaseService):
         
         if perm.is_employee() and user_email and user_email != current_user_email:
              return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
-         
-        result = self._set_dates_range(date_range_type, selected_year, selected_month, start_date_str, end_date_str)
-        if isinstance(result, RC):
-            return result
-        
-        start_date, end_date = result
 
         user: User = self.user_repository.get_user_by_email(user_email)
         if isinstance (user, RC):
@@ -137,8 +131,8 @@ class ReportService(BaseService):
 
         return report_entry
 
-    def company_summary(self, company_id: str, date_range_type: str, selected_year: str, selected_month: str, start_date_str: str, \
-                end_date_str: str, user_permission: int, user_company_id: str) -> dict|RC:
+    def company_summary(self, company_id: str, start_date: datetime, end_date: datetime, user_permission: int, \
+                user_company_id: str) -> Iterator[dict]|RC:
         """
         Generates a summary report for a specific company.
 
@@ -149,16 +143,13 @@ class ReportService(BaseService):
 
         Args:
             company_id (str): The ID of the company for which to generate the report.
-            date_range_type (str): The type of date range selection ('monthly' or 'custom').
-            selected_year (str): The year selected for the report (if date_range_type is 'monthly').
-            selected_month (str): The month selected for the report (if date_range_type is 'monthly').
-            start_date_str (str): The start date of the custom date range (if date_range_type is 'custom').
-            end_date_str (str): The end date of the custom date range (if date_range_type is 'custom').
+            start_date (datetime): The start date of the report range.
+            end_date (datetime): The end date of the report range.
             user_permission (int): The permission level of the user initiating the request.
             user_company_id (str): The company ID of the user initiating the request.
 
         Returns:
-            dict|RC: A dictionary containing the company summary report data if successful, 
+            Iterator[dict]|RC: A generator of user report entries if successful, 
                     otherwise an RC object indicating an error.
         """
         perm: Permission = Permission(user_permission)
@@ -171,26 +162,9 @@ class ReportService(BaseService):
         if perm.is_employer() and (str(user_company_id) != str(company_id)):
             return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
         
-        result = self._set_dates_range(date_range_type, selected_year, selected_month, start_date_str, end_date_str)
-        if isinstance(result, RC):
-            return result
-        
-        start_date, end_date = result
-        
-        users: list[User] = self.company_repository.get_company_users(company_id=company_id)
-        report = []
-        for user in users:
-            timestamps: list[TimeStamp] = self.timestamp_repository.get_range(start_date, end_date, user.email)
+        return self._company_summary_rows(company_id, start_date, end_date)
 
-            days_worked, paid_days_off, unpaid_days_off, days_not_reported, total_hours_worked, potential_work_days, _\
-                =self._calculate_work_days(user, timestamps, start_date, end_date)
-            
-            report_entry: dict = self._generate_report_entry(user, days_worked, paid_days_off, unpaid_days_off, days_not_reported, total_hours_worked, potential_work_days, start_date, end_date)
-            report.append(report_entry)
-
-        return report
-
-    def company_overview(self, date_range_type: str, selected_year: str, selected_month: str, start_date_str: str, end_date_str: str, user_permission: int) -> dict| RC:
+    def company_overview(self, start_date: datetime, end_date: datetime, user_permission: int) -> Iterator[dict]| RC:
         """
         Generates an overview report for all active companies.
 
@@ -200,15 +174,12 @@ class ReportService(BaseService):
         provides a high-level summary of company performance and workforce data.
 
         Args:
-            date_range_type (str): The type of date range selection ('monthly' or 'custom').
-            selected_year (str): The year selected for the report (if date_range_type is 'monthly').
-            selected_month (str): The month selected for the report (if date_range_type is 'monthly').
-            start_date_str (str): The start date of the custom date range (if date_range_type is 'custom').
-            end_date_str (str): The end date of the custom date range (if date_range_type is 'custom').
+            start_date (datetime): The start date of the report range.
+            end_date (datetime): The end date of the report range.
             user_permission (int): The permission level of the user initiating the request.
 
         Returns:
-            dict| RC: A dictionary containing the company overview report data if successful, 
+            Iterator[dict]| RC: A generator of company report entries if successful, 
                     otherwise an RC object indicating an error.
         """
         perm: Permission = Permission(user_permission)
@@ -218,46 +189,77 @@ class ReportService(BaseService):
         if not perm.is_net_admin():
             return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
         
-        result = self._set_dates_range(date_range_type, selected_year, selected_month, start_date_str, end_date_str)
-        if isinstance(result, RC):
-            return result
-        
-        start_date, end_date = result
-        
+        # Four queries in total, however many companies and employees there are
         companies: list[Company] = self.company_repository.get_all_active_companies()
+        company_ids = [company.company_id for company in companies]
+        admins_by_company: dict[str, list[User]] = self.company_repository.get_admins_by_company(company_ids)
+        employees_by_company: dict[str, list[User]] = self.company_repository.get_users_by_company(company_ids)
+        work_time_by_user: dict[str, int] | RC = self.timestamp_repository.work_time_by_user(
+            [employee.email for employees in employees_by_company.values() for employee in employees], start_date, end_date)
+        if isinstance(work_time_by_user, RC):
+            return work_time_by_user
         
-        report = []
+        return self._company_overview_rows(companies, admins_by_company, employees_by_company, work_time_by_user)
+
+    def _company_summary_rows(self, company_id: str, start_date: datetime, end_date: datetime) -> Iterator[dict]:
+        """
+        Lazily generates the company summary report entries, one per active user of the company.
+
+        Args:
+            company_id (str): The ID of the company.
+            start_date (datetime): The start date of the report range.
+            end_date (datetime): The end date of the report range.
+
+        Yields:
+            dict: The report entry of one user.
+        """
+        users: list[User] = self.company_repository.get_company_users(company_id=company_id)
+        for user in users:
+            timestamps: list[TimeStamp] = self.timestamp_repository.get_range(start_date, end_date, user.email)
+
+            days_worked, paid_days_off, unpaid_days_off, days_not_reported, total_hours_worked, potential_work_days, _\
+                =self._calculate_work_days(user, timestamps, start_date, end_date)
+            
+            yield self._generate_report_entry(user, days_worked, paid_days_off, unpaid_days_off, days_not_reported, total_hours_worked, potential_work_days, start_date, end_date)
+
+    def _company_overview_rows(self, companies: list[Company], admins_by_company: dict[str, list[User]], 
+                               employees_by_company: dict[str, list[User]], work_time_by_user: dict[str, int]) -> Iterator[dict]:
+        """
+        Lazily generates the company overview report entries, one per active company, from prefetched data.
+
+        Args:
+            companies (list[Company]): The active companies.
+            admins_by_company (dict[str, list[User]]): The admin users of each company, keyed by company ID.
+            employees_by_company (dict[str, list[User]]): The active users of each company, keyed by company ID.
+            work_time_by_user (dict[str, int]): The work time in seconds of each user within the report range, keyed by email.
+
+        Yields:
+            dict: The report entry of one company.
+        """
         for company in companies:
-            employees: list[User] = self.company_repository.get_company_users(company_id=company.company_id)
+            employees: list[User] = employees_by_company.get(company.company_id, [])
             num_employees = len(employees)
             total_hours_worked = 0
             total_monthly_salary = 0
             monthly_payments = []
 
             for employee in employees:
-                employee_time_stamps = self.timestamp_repository.get_range(start_date, end_date, employee.email)
-                employee_hours_worked = 0
-                for ts in employee_time_stamps:
-                    employee_hours_worked += ts.total_work_time or 0
-                
-                total_hours_worked += employee_hours_worked
+                total_hours_worked += work_time_by_user.get(employee.email, 0)
 
                 monthly_payment = self._calculate_salary(total_hours_worked, float(employee.salary or 0))
                 total_monthly_salary += monthly_payment
                 monthly_payments.append(round(monthly_payment, 2))
             
-            admin_users: list[User] = self.company_repository.get_company_admins(company.company_id)
+            admin_users: list[User] = admins_by_company.get(company.company_id, [])
             admin_names = [admin.first_name + " " + admin.last_name for admin in admin_users]
-            report.append( {
+            yield {
                 "companyName": company.company_name,
                 "numEmployees": num_employees,
                 "totalHoursWorked": format_hours_to_hhmm(total_hours_worked),
                 "totalMonthlySalary": round(total_monthly_salary, 2),
                 "monthlyPayments": monthly_payments,
                 "adminNames": admin_names
-            })
-            
-        return report
+            }
         
         
     def _calculate_work_days(self, user: User, time_stamps: list[TimeStamp], start_date: datetime, end_date: datetime) -> tuple:
@@ -293,12 +295,13 @@ class ReportService(BaseService):
         days_worked = 0
         potential_work_days = 0
         current_date = start_date
+        weekend_days = parse_weekend_choice(user.weekend_choice)
 
         while current_date <= end_date:
             found_entry = False
             work_type = None
             daily_hours = 0
-            if not user.weekend_choice or current_date.strftime('%A').lower() not in map(str.lower, user.weekend_choice.split(',')):  
+            if current_date.weekday() not in weekend_days:
                 potential_work_days += 1
                 for ts in time_stamps:
                     if ts.punch_in_timestamp.date() == current_date.date():
@@ -385,52 +388,6 @@ class ReportService(BaseService):
         
         return report
     
-    def _set_dates_range(self, date_range_type: str, selected_year: str, selected_month: str, start_date_str: str, end_date_str: str)->tuple|RC:
-        """
-        Sets the start and end dates for the report based on the selected date range type.
-
-        This method handles the logic for determining the appropriate start and end dates for the report. 
-        It supports two types of date ranges: 'monthly' and 'custom'. For 'monthly' reports, it calculates 
-        the start and end dates of the selected month. For 'custom' reports, it parses the provided start 
-        and end date strings.
-
-        Args:
-            date_range_type (str): The type of date range selection ('monthly' or 'custom').
-            selected_year (str): The year selected for the report (if date_range_type is 'monthly').
-            selected_month (str): The month selected for the report (if date_range_type is 'monthly').
-            start_date_str (str): The start date of the custom date range (if date_range_type is 'custom').
-            end_date_str (str): The end date of the custom date range (if date_range_type is 'custom').
-
-        Returns:
-            tuple|RC: A tuple containing the start_date and end_date as datetime objects if successful, 
-                    otherwise an RC object indicating an error.
-        """
-        if date_range_type == 'monthly':
-            if not selected_year or not selected_month:
-                return RC(E_RC.RC_INVALID_INPUT, 'Year and month are required for monthly reports')
-
-            year = int(selected_year)
-            month = int(selected_month)
-            start_date = datetime(year, month, 1, tzinfo=timezone.utc)
-            end_date = datetime(year, month, calendar.monthrange(year, month)[1], tzinfo=timezone.utc)
-            return start_date, end_date
-        
-        elif date_range_type == 'custom':
-            if not start_date_str or not end_date_str:
-                return RC(E_RC.RC_INVALID_INPUT, 'Start and end dates are required for custom reports')
-            try:
-                start_date = iso2datetime(start_date_str)
-                end_date = iso2datetime(end_date_str)
-                if end_date < start_date:
-                    return RC(E_RC.RC_INVALID_INPUT, 'Start date must earlier than end date')
-                
-                return start_date, end_date
-            
-            except ValueError:
-                return RC(E_RC.RC_INVALID_INPUT, 'Invalid date format')
-        else:
-            return RC(E_RC.RC_INVALID_INPUT, 'Invalid date range type')
-        
     def _calculate_salary(self, total_hours_worked: float|str, salary: float|str) ->float:
         """
         Calculates the salary for a user based on their total hours worked and hourly salary.
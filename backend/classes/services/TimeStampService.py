@@ -3,6 +3,7 @@ from classes.domainclasses.TimeStamp import TimeStamp
 from classes.utilities.RC import RC, E_RC
 from cmn_utils import *
 from datetime import datetime, timezone
+from typing import Iterator
 from classes.validators.ModelValidator import ModelValidator
 from classes.repositories.TimeStampRepository import TimeStampRepository
 from classes.repositories.UserRepository import UserRepository
@@ -26,6 +27,10 @@ class TimeStampService(BaseService):
                           Creates a new timestamp record. Handles different cases for punch_in and punch_out values,
                           performs validation, and saves the timestamp to the repository.
 
+        create_timestamps_bulk(self, records: list, entered_by_user: str, user_permission: int, user_company_id: str) -> int | RC: 
+                          Creates many timestamp records in one transaction. Authorizes and validates every record,
+                          then inserts them with chunked executemany statements.
+
         punch_out(self, user_email: str, entered_by: str, reporting_type: str, detail: str, user_permission: int,
                   user_company_id: str) -> RC: 
                   Updates an existing timestamp with punch-out information. Retrieves the latest punch-in timestamp
@@ -42,18 +47,28 @@ class TimeStampService(BaseService):
                        before deleting it from the repository.
 
         get_timestamps_range(self, user_email: str, start_date_str: str, end_date_str: str, current_user_email: str,
-                             user_permission: int, user_company_id: str) -> list | RC: 
+                             user_permission: int, user_company_id: str) -> Iterator[dict] | RC: 
                              Retrieves timestamps within a specific date range. Performs authorization checks and
-                             returns a list of timestamps within the given range for the specified user.
+                             returns a generator of timestamps within the given range for the specified user.
 
         check_punch_in_status(self, user_email: str, current_user_email ,user_permission: int, user_company_id: str) -> bool | RC: 
                              Checks if a user is currently punched in. Retrieves the latest timestamp for the user and
                              checks if it has a punch_out_timestamp.
 
-        get_all_timestamps(self, user_permission: int) -> list | RC: 
-                             Retrieves all timestamp records. Performs authorization checks and returns a list of all
+        check_punch_in_status_bulk(self, user_emails: list, current_user_email: str, user_permission: int, user_company_id: str) -> dict | RC: 
+                             Checks which of several users are currently punched in, using a single query for all of them.
+
+        get_all_timestamps(self, user_permission: int) -> Iterator[dict] | RC: 
+                             Retrieves all timestamp records. Performs authorization checks and returns a generator of all
                              timestamps in the repository.
 
+        _new_timestamp(self, user_email: str, entered_by_user: str, punch_type: int, punch_in: str, punch_out: str,
+                       reporting_type: str, detail: str) -> TimeStamp | RC: 
+                             Builds a new, unsaved timestamp from request values, handling the punch_in and punch_out cases.
+
+        _today_range(self) -> tuple: 
+                             Returns the start and end of the current UTC day.
+
         _iso_str_to_utc_datetime(self, date_str: str): 
                              Converts an ISO formatted date string to a datetime object in UTC timezone. Handles potential
                              ValueError exceptions during the conversion.
@@ -110,60 +125,69 @@ class TimeStampService(BaseService):
         if perm.is_employer() and user_company_id != user.company_id:
             return RC(E_RC.RC_UNAUTHORIZED, 'Unauthorized access')
 
+        new_timestamp: TimeStamp | RC = self._new_timestamp(user_email, entered_by_user, punch_type, punch_in, punch_out, reporting_type, detail)
+        if isinstance(new_timestamp, RC):
+            return new_timestamp
         
-        if punch_in:
-            punch_in_datetime = self._iso_str_to_utc_datetime(punch_in)
-            if isinstance(punch_in_datetime, RC):
-                return punch_in_datetime
-            
-        if punch_out:
-            punch_out_datetime= self._iso_str_to_utc_datetime(punch_out)
-            if isinstance(punch_out_datetime, RC):
-                return punch_out_datetime
-            
-        if not punch_in and not punch_out:
-            punch_in_timestamp = datetime.now(timezone.utc)
-            new_timestamp_data: dict = {
-                'user_email': user_email,
-                'entered_by': entered_by_user,
-                'punch_type': punch_type,
-                'punch_in_timestamp': punch_in_timestamp,
-                'reporting_type': reporting_type,
-                'detail': detail
-                }
-    
-        elif punch_in and not punch_out:
-            new_timestamp_data: dict = {
-                'user_email': user_email,
-                'entered_by': entered_by_user,
-                'punch_type': punch_type,
-                'punch_in_timestamp': punch_in_datetime,
-                'reporting_type': reporting_type,
-                'detail': detail
-                }   
+        return self._save(self.timestamp_repository, new_timestamp)
 
-        elif punch_in and punch_out:
-            if punch_in_datetime > punch_out_datetime:
-                return RC(E_RC.RC_INVALID_INPUT, 'Start time should be earlier than end time')
-            
-            new_timestamp_data: dict = {
-                'user_email': user_email,
-                'entered_by': entered_by_user,
-                'punch_type': punch_type,
-                'punch_in_timestamp': punch_in_datetime,
-                'punch_out_timestamp': punch_out_datetime,
-                'reporting_type': reporting_type,
-                'detail': detail
-                }
+    def create_timestamps_bulk(self, records: list, entered_by_user: str, user_permission: int, user_company_id: str) -> int | RC:
+        """Creates many timestamp records in one transaction.
+
+        Every record is authorized and validated like in `create_timestamp` before anything is written.
+        The users referenced by the records are loaded with a single query, and the rows are inserted in chunks.
+
+        Args:
+            records (list): A list of dictionaries with the same keys as the single create request.
+            entered_by_user (str): The email of the user who created the timestamps.
+            user_permission (int): The permission level of the user making the request.
+            user_company_id (str): The company ID of the user.
+
+        Returns:
+            int | RC: The number of inserted timestamps, or an RC object indicating failure.
+        """
+        if not isinstance(records, list) or not records:
+            return RC(E_RC.RC_INVALID_INPUT, 'Expected a non-empty list of timestamps')
         
-        else:
-            return RC(E_RC.RC_INVALID_INPUT, 'Start time should be earlier than end time')
+        perm: Permission = Permission(user_permission)
+        
+        if any(not isinstance(record, dict) for record in records):
+            return RC(E_RC.RC_INVALID_INPUT, 'Every timestamp must be an object')
+        
+        if any(not isinstance(record.get('user_email'), str) for record in records):
+            return RC(E_RC.RC_INVALID_INPUT, 'Every timestamp must have a user email string')
 
-        new_timestamp: TimeStamp = self.factory.create("timestamp", **new_timestamp_data)
-        if isinstance(new_timestamp, RC):
-            return new_timestamp
+        users: dict[str, User] = self.user_repository.get_users_by_emails(list({record.get('user_email') for record in records}))
+
+        new_timestamps: list[TimeStamp] = []
+        for index, record in enumerate(records):
+            user_email = record.get('user_email')
+            if perm.is_employee() and entered_by_user != user_email:
+                return RC(E_RC.RC_UNAUTHORIZED, 'Unauthorized access')
+
+            user: User = users.get(user_email)
+            if user is None:
+                return RC(E_RC.RC_NOT_FOUND, f"User not found for: {user_email}")
+
+            if perm.is_employer() and user_company_id != user.company_id:
+                return RC(E_RC.RC_UNAUTHORIZED, 'Unauthorized access')
+
+            new_timestamp: TimeStamp | RC = self._new_timestamp(user_email, entered_by_user, record.get('punch_type'), record.get('punch_in_timestamp'),
+                                                                record.get('punch_out_timestamp'), record.get('reporting_type'), record.get('detail'))
+            if isinstance(new_timestamp, RC):
+                return RC(new_timestamp.code, f"Timestamp {index}: {new_timestamp.description}")
+
+            validation_result = self.validator.validate(new_timestamp)
+            if not validation_result.is_ok():
+                return RC(validation_result.code, f"Timestamp {index}: {validation_result.description}")
+
+            new_timestamps.append(new_timestamp)
+
+        rc: RC = self.timestamp_repository.bulk_insert(new_timestamps)
+        if not rc.is_ok():
+            return rc
         
-        return self._save(self.timestamp_repository, new_timestamp)
+        return len(new_timestamps)
 
     def punch_out(self, user_email: str, entered_by: str,
                   reporting_type: str, detail: str, user_permission: int,
@@ -318,7 +342,7 @@ class TimeStampService(BaseService):
     def get_timestamps_range(self, user_email: str, start_date_str: str,
                              end_date_str: str, current_user_email: str,
                              user_permission: int,
-                             user_company_id: str) -> list | RC:
+                             user_company_id: str) -> Iterator[dict] | RC:
         """Retrieves timestamps within a specific date range.
 
         Performs authorization checks and returns a list of timestamps within 
@@ -333,7 +357,7 @@ class TimeStampService(BaseService):
             user_company_id (str): The company ID of the user.
 
         Returns:
-            list | RC: A list of timestamps (as dictionaries) or an RC object indicating failure.
+            Iterator[dict] | RC: A generator of timestamps (as dictionaries) or an RC object indicating failure.
         """
         if not user_email or not start_date_str or not end_date_str:
                 return RC(E_RC.RC_INVALID_INPUT, 'Missing start_date or end_date')
@@ -364,7 +388,7 @@ class TimeStampService(BaseService):
         if isinstance(timestamps, RC):
             return timestamps
             
-        return [timestamp.to_dict() for timestamp in timestamps]
+        return (timestamp.to_dict() for timestamp in timestamps)
 
     def check_punch_in_status(self, user_email: str, current_user_email ,user_permission: int,
                               user_company_id: str) -> bool | RC:
@@ -395,9 +419,7 @@ class TimeStampService(BaseService):
         if perm.is_employer() and user_company_id != user.company_id:
             return RC(E_RC.RC_UNAUTHORIZED, 'Unauthorized access')
 
-        today = datetime.now(timezone.utc).date()
-        start_of_day = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
-        end_of_day = datetime.combine(today, datetime.max.time()).replace(tzinfo=timezone.utc)
+        start_of_day, end_of_day = self._today_range()
             
         timestamp: TimeStamp | RC = self.timestamp_repository.check_punch_in_status(user_email, start_of_day, end_of_day)
         if isinstance(timestamp, RC):
@@ -407,8 +429,51 @@ class TimeStampService(BaseService):
             return True
         else:
             return False
+
+    def check_punch_in_status_bulk(self, user_emails: list, current_user_email: str, user_permission: int,
+                                   user_company_id: str) -> dict | RC:
+        """Checks which of several users are currently punched in, with one query for all of them.
+
+        Applies the same authorization rules as `check_punch_in_status` to every requested user.
+
+        Args:
+            user_emails (list): The emails of the users to check.
+            current_user_email (str): The email of the user making the request.
+            user_permission (int): The permission level of the user making the request.
+            user_company_id (str): The company ID of the user.
+
+        Returns:
+            dict | RC: A dictionary mapping each email to True if the user is punched in, or an RC object indicating failure.
+        """
+        if not isinstance(user_emails, list) or not user_emails:
+            return RC(E_RC.RC_INVALID_INPUT, 'Expected a non-empty list of emails')
+        
+        if any(not isinstance(user_email, str) for user_email in user_emails):
+            return RC(E_RC.RC_INVALID_INPUT, 'Every email must be a string')
         
-    def get_all_timestamps(self, user_permission: int) -> list | RC:
+        perm: Permission = Permission(user_permission)
+        
+        if perm.is_employee() and any(user_email != current_user_email for user_email in user_emails):
+            return RC(E_RC.RC_UNAUTHORIZED, 'Unauthorized access')
+
+        users: dict[str, User] = self.user_repository.get_users_by_emails(user_emails)
+        for user_email in user_emails:
+            user: User = users.get(user_email)
+            if user is None:
+                return RC(E_RC.RC_NOT_FOUND, f"User not found for: {user_email}")
+
+            if perm.is_employer() and user_company_id != user.company_id:
+                return RC(E_RC.RC_UNAUTHORIZED, 'Unauthorized access')
+
+        start_of_day, end_of_day = self._today_range()
+
+        punched_in: set[str] | RC = self.timestamp_repository.users_with_open_punch(user_emails, start_of_day, end_of_day)
+        if isinstance(punched_in, RC):
+            return punched_in
+        
+        return {user_email: user_email in punched_in for user_email in user_emails}
+        
+    def get_all_timestamps(self, user_permission: int) -> Iterator[dict] | RC:
         """Retrieves all timestamp records.
 
         Performs authorization checks and returns a list of all timestamps in the repository.
@@ -417,7 +482,7 @@ class TimeStampService(BaseService):
             user_permission (int): The permission level of the user making the request.
 
         Returns:
-            list | RC: A list of all timestamps (as dictionaries), or an RC object indicating failure.
+            Iterator[dict] | RC: A generator of all timestamps (as dictionaries), or an RC object indicating failure.
         """
         perm: Permission = Permission(user_permission)
         if isinstance(perm, RC):
@@ -427,9 +492,88 @@ class TimeStampService(BaseService):
             return RC(E_RC.RC_UNAUTHORIZED, 'Unauthorized access')
 
         timestamps = self.timestamp_repository.get_all_timestamps()
-        return [timestamp.to_dict() for timestamp in timestamps]
+        return (timestamp.to_dict() for timestamp in timestamps)
     
 
+    def _new_timestamp(self, user_email: str, entered_by_user: str, punch_type: int, punch_in: str, punch_out: str,
+                       reporting_type: str, detail: str) -> TimeStamp | RC:
+        """Builds a new, unsaved timestamp from request values.
+
+        A missing punch_in and punch_out means punching in now.
+
+        Args:
+            user_email (str): The email of the user for whom the timestamp is created.
+            entered_by_user (str): The email of the user who created the timestamp.
+            punch_type (int): The type of punch.
+            punch_in (str): ISO formatted string representing the punch-in time. Can be None.
+            punch_out (str): ISO formatted string representing the punch-out time. Can be None.
+            reporting_type (str): The type of reporting for the timestamp.
+            detail (str): Additional details about the timestamp.
+
+        Returns:
+            TimeStamp | RC: The new TimeStamp object, or an RC object indicating invalid input.
+        """
+        if punch_in:
+            punch_in_datetime = self._iso_str_to_utc_datetime(punch_in)
+            if isinstance(punch_in_datetime, RC):
+                return punch_in_datetime
+            
+        if punch_out:
+            punch_out_datetime= self._iso_str_to_utc_datetime(punch_out)
+            if isinstance(punch_out_datetime, RC):
+                return punch_out_datetime
+            
+        if not punch_in and not punch_out:
+            punch_in_timestamp = datetime.now(timezone.utc)
+            new_timestamp_data: dict = {
+                'user_email': user_email,
+                'entered_by': entered_by_user,
+                'punch_type': punch_type,
+                'punch_in_timestamp': punch_in_timestamp,
+                'reporting_type': reporting_type,
+                'detail': detail
+                }
+    
+        elif punch_in and not punch_out:
+            new_timestamp_data: dict = {
+                'user_email': user_email,
+                'entered_by': entered_by_user,
+                'punch_type': punch_type,
+                'punch_in_timestamp': punch_in_datetime,
+                'reporting_type': reporting_type,
+                'detail': detail
+                }   
+
+        elif punch_in and punch_out:
+            if punch_in_datetime > punch_out_datetime:
+                return RC(E_RC.RC_INVALID_INPUT, 'Start time should be earlier than end time')
+            
+            new_timestamp_data: dict = {
+                'user_email': user_email,
+                'entered_by': entered_by_user,
+                'punch_type': punch_type,
+                'punch_in_timestamp': punch_in_datetime,
+                'punch_out_timestamp': punch_out_datetime,
+                'reporting_type': reporting_type,
+                'detail': detail
+                }
+        
+        else:
+            return RC(E_RC.RC_INVALID_INPUT, 'Start time should be earlier than end time')
+
+        return self.factory.create("timestamp", **new_timestamp_data)
+
+    def _today_range(self) -> tuple:
+        """Returns the start and end of the current UTC day.
+
+        Returns:
+            tuple: The start_of_day and end_of_day as datetime objects in UTC timezone.
+        """
+        today = datetime.now(timezone.utc).date()
+        start_of_day = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
+        end_of_day = datetime.combine(today, datetime.max.time()).replace(tzinfo=timezone.utc)
+        return start_of_day, end_of_day
+
     def _iso_str_to_utc_datetime(self, date_str: str):
         """Converts an ISO formatted date string to a datetime object in UTC timezone.
 
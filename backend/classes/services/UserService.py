@@ -1,15 +1,33 @@
 from classes.domainclasses.User import User
 from cmn_utils import *
-import bcrypt
 from classes.validators.ModelValidator import ModelValidator
 from classes.repositories.UserRepository import UserRepository
 from classes.repositories.CompanyRepository import CompanyRepository
 from classes.factories.DomainClassFactory import DomainClassFactory
 from classes.domainclasses.Company import Company
-from classes.utilities.Permission import Permission
+from classes.utilities.Permission import Permission, E_PERMISSIONS
+from classes.utilities.PasswordHasher import PasswordHasherInterface
 from classes.utilities.RC import RC, E_RC
 from classes.services.BaseServiceClass import BaseService
+from typing import Iterator
 
+def _user_row_to_dict(row) -> dict:
+    """
+    Converts a user list row to the same dictionary `User.to_dict` produces, plus the company name.
+
+    Args:
+        row (RowMapping): A row selected by the user repository list methods.
+
+    Returns:
+        dict: The user dictionary.
+    """
+    user_dict = dict(row)
+    user_dict['company_id'] = str(row['company_id'])
+    user_dict['salary'] = str(row['salary']) if row['salary'] else None
+    user_dict['work_capacity'] = str(row['work_capacity']) if row['work_capacity'] else None
+    user_dict['employment_start'] = datetime2iso(row['employment_start'])
+    user_dict['employment_end'] = datetime2iso(row['employment_end'])
+    return user_dict
 
 class UserService(BaseService):
     """
@@ -45,20 +63,22 @@ class UserService(BaseService):
         get_user_by_email(self, user_permission: int, current_user_email: str, user_company_id, requested_user_email: str) -> RC|dict:
                         Retrieves user information by email address.
 
-        get_active_users(self, user_permission: int, user_company_id: str = None) -> list:
-                        Retrieves a list of active user accounts.
+        get_active_users(self, user_permission: int, user_company_id: str = None) -> str:
+                        Retrieves the active user accounts as a JSON array.
 
         get_inactive_users(self, user_permission: int, user_company_id: str = None) -> list:
                         Retrieves a list of inactive user accounts.
 
-        get_all_users(self, user_permission: int, user_company_id: str = None) -> list:
-                        Retrieves a list of all user accounts (active and inactive).
+        get_all_users(self, user_permission: int, user_company_id: str = None) -> Iterator[dict]:
+                        Lazily retrieves all user accounts (active and inactive).
     """
-    def __init__(self, user_repository: UserRepository, company_repository: CompanyRepository, validator: ModelValidator, factory: DomainClassFactory):
+    def __init__(self, user_repository: UserRepository, company_repository: CompanyRepository, validator: ModelValidator, factory: DomainClassFactory,
+                 password_hasher: PasswordHasherInterface):
         """Initializes UserService with required repositories and utilities."""
         super().__init__(validator, factory)
         self.user_repository = user_repository
         self.company_repository = company_repository
+        self.password_hasher = password_hasher
 
     def create_user(self, email: str, first_name: str, last_name: str, company_name: str,
                    role: str, permission: int, password: str, salary: float, work_capacity: float,
@@ -88,15 +108,15 @@ class UserService(BaseService):
             RC: An RC object indicating the success or failure of the operation.
         """
         perm: Permission = Permission(user_permission)
-        if isinstance(perm, RC):
-            return perm
         
         if not perm.is_net_admin():
             return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
         
-        if not first_name or not last_name or not email or not password or not company_name\
-            or not role or not permission or not salary or not work_capacity or not employment_start_str:
-                return RC(E_RC.RC_INVALID_INPUT, "Missing mandatory user field")
+        if any(field in (None, "") for field in (email, first_name, last_name, company_name, role, password, employment_start_str)):
+            return RC(E_RC.RC_INVALID_INPUT, "Missing mandatory user field")
+
+        if permission is None or salary is None or work_capacity is None:
+            return RC(E_RC.RC_INVALID_INPUT, "Missing mandatory user field")
             
         company: Company = self.company_repository.get_company_by_name(company_name)
         if isinstance(company, RC):
@@ -113,12 +133,12 @@ class UserService(BaseService):
             'company_id': company.company_id, 
             'role': role,
             'permission': permission,
-            'pass_hash': bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8'),
+            'pass_hash': self.password_hasher.hash(password),
             'is_active': True,
             'salary': float(salary),
             'work_capacity': float(work_capacity),
             'employment_start': iso2datetime(employment_start_str),
-            'employment_end': iso2datetime(employment_end_str),
+            'employment_end': iso2datetime(employment_end_str) if employment_end_str else None,
             'weekend_choice': weekend_choice,
             'mobile_phone': mobile_phone
             }
@@ -157,8 +177,6 @@ class UserService(BaseService):
             RC: An RC object indicating the success or failure of the update operation.
         """
         perm: Permission = Permission(user_permission)
-        if isinstance(perm, RC):
-            return perm
         
         if not perm.is_net_admin():
             return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
@@ -180,7 +198,7 @@ class UserService(BaseService):
         if mobile_phone:
             user.mobile_phone = mobile_phone
         if password:
-            user.pass_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+            user.pass_hash = self.password_hasher.hash(password)
         if salary is not None:
             user.salary = float(salary)
         if work_capacity is not None:
@@ -209,8 +227,6 @@ class UserService(BaseService):
             RC: An RC object indicating success or failure.
         """
         perm: Permission = Permission(user_permission)
-        if isinstance(perm, RC):
-            return perm
         
         if not perm.is_net_admin():
             return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
@@ -220,7 +236,7 @@ class UserService(BaseService):
             return user
         
         user.is_active = False
-        user.employment_end = iso2datetime(employment_end_str)
+        user.employment_end = iso2datetime(employment_end_str) if employment_end_str else None
         
         return self._update(self.user_repository, user)
 
@@ -240,18 +256,17 @@ class UserService(BaseService):
             RC: An RC object indicating success or failure.
         """
         perm: Permission = Permission(user_permission)
-        if isinstance(perm, RC):
-            return perm
         
         user: User | RC = self.user_repository.get_user_by_email(user_email)
         if isinstance(user, RC):
             return user
         
-        if perm.is_net_admin() or \
-            (perm.is_employer() and current_user_company == user.company_id) or \
-                (perm.is_employee() and current_user_email == user.email):
+        role = perm.permission
+        if role == E_PERMISSIONS.net_admin or \
+            (role == E_PERMISSIONS.employer and current_user_company == user.company_id) or \
+                (role == E_PERMISSIONS.employee and current_user_email == user.email):
                     
-            user.pass_hash=bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+            user.pass_hash=self.password_hasher.hash(new_password)
             return self._update(self.user_repository, user)
         
         return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
@@ -269,8 +284,6 @@ class UserService(BaseService):
             RC: An RC object indicating success or failure.
         """
         perm: Permission = Permission(user_permission)
-        if isinstance(perm, RC):
-            return perm
         
         if not perm.is_net_admin():
             RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
@@ -299,24 +312,24 @@ class UserService(BaseService):
             RC|dict: A dictionary containing user information if successful, or an RC object indicating failure.
         """
         perm: Permission = Permission(user_permission)
-        if isinstance(perm, RC):
-            return perm
+
+        # Checks that need only the token run before the lookup, so rejected requests never reach the DB
+        if perm.is_employee() and current_user_email and current_user_email != requested_user_email:
+            return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
+        if perm.is_employer() and not user_company_id:
+            return RC(E_RC.RC_INVALID_INPUT, "No user company id found")
         
-        requested_user: User = self.user_repository.get_user_by_email(requested_user_email)
+        requested_user: User | RC = self.user_repository.get_user_by_email(requested_user_email)
+        if isinstance(requested_user, RC):
+            return requested_user
         
-        if perm.is_employer():
-            if not user_company_id:
-                return RC(E_RC.RC_INVALID_INPUT, "No user company id found")
-            if user_company_id != requested_user.company_id:
-                return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
-            
-        if perm.is_employee() and current_user_email and current_user_email != requested_user.email:
+        if perm.is_employer() and user_company_id != requested_user.company_id:
             return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
 
         return requested_user.to_dict()
     
-    def get_active_users(self, user_permission: int, user_company_id: str = None) -> list:
-        """Retrieves a list of active user accounts.
+    def get_active_users(self, user_permission: int, user_company_id: str = None) -> str:
+        """Retrieves the active user accounts as a JSON array encoded by the database.
 
         Performs authorization checks and filters users based on company ID if necessary.
 
@@ -325,29 +338,19 @@ class UserService(BaseService):
             user_company_id (str, optional): The company ID to filter users by. Defaults to None.
 
         Returns:
-            list: A list of dictionaries, each containing information about an active user.
+            str: A JSON array of objects, each containing information about an active user.
         """
         perm: Permission = Permission(user_permission)
-        if isinstance(perm, RC):
-            return perm
         
         if perm.is_net_admin():
-            active_users: list[User] = self.user_repository.get_active_users()
-        elif perm.is_employer:
+            return self.user_repository.get_active_users_json()
+        elif perm.is_employer():
             if not user_company_id:
                 return RC(E_RC.RC_INVALID_INPUT, "No user company id found")
             
-            active_users: list[User] = self.user_repository.get_active_users(user_company_id)
+            return self.user_repository.get_active_users_json(user_company_id)
         else:
             return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
-
-        user_data = []
-        for user in active_users:
-            user_dict = user.to_dict()
-            user_dict['company_name'] = self.company_repository.get_company_by_id(user.company_id).company_name
-            user_data.append(user_dict)
-
-        return user_data
     
     def get_inactive_users(self, user_permission: int, user_company_id: str = None) -> list:
         """Retrieves a list of inactive user accounts.
@@ -362,29 +365,21 @@ class UserService(BaseService):
             list: A list of dictionaries, each containing information about an inactive user.
         """
         perm: Permission = Permission(user_permission)
-        if isinstance(perm, RC):
-            return perm
         
         if perm.is_net_admin():
-            active_users: list[User] = self.user_repository.get_inactive_users()
-        elif perm.is_employer:
+            active_users = self.user_repository.get_inactive_users()
+        elif perm.is_employer():
             if not user_company_id:
                 return RC(E_RC.RC_INVALID_INPUT, "No user company id found")
             
-            active_users: list[User] = self.user_repository.get_inactive_users(user_company_id)
+            active_users = self.user_repository.get_inactive_users(user_company_id)
         else:
             return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
 
-        user_data = []
-        for user in active_users:
-            user_dict = user.to_dict()
-            user_dict['company_name'] = self.company_repository.get_company_by_id(user.company_id).company_name
-            user_data.append(user_dict)
-
-        return user_data
+        return [_user_row_to_dict(row) for row in active_users]
 
-    def get_all_users(self, user_permission: int, user_company_id: str = None) -> list:
-        """Retrieves a list of all user accounts (active and inactive).
+    def get_all_users(self, user_permission: int, user_company_id: str = None) -> Iterator[dict]:
+        """Lazily retrieves all user accounts (active and inactive).
 
         Performs authorization checks and filters users based on company ID if necessary.
 
@@ -393,26 +388,18 @@ class UserService(BaseService):
             user_company_id (str, optional): The company ID to filter users by. Defaults to None.
 
         Returns:
-            list: A list of dictionaries, each containing information about a user.
+            Iterator[dict]: A generator of dictionaries, each containing information about a user.
         """
         perm: Permission = Permission(user_permission)
-        if isinstance(perm, RC):
-            return perm
         
-        if perm.is_net_admin:
-            users: list[User] = self.user_repository.get_users()  
+        if perm.is_net_admin():
+            users = self.user_repository.get_users()
             
         elif perm.is_employer():
             if not user_company_id:
                 return RC(E_RC.RC_INVALID_INPUT, "No user company id found")
-            users: list[User] = self.user_repository.get_active_users(user_company_id)
+            users = self.user_repository.get_active_users(user_company_id)
         else:
             return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access")
 
-        user_data = []
-        for user in users:
-            user_dict = user.to_dict()
-            user_dict['company_name'] = self.company_repository.get_company_by_id(user.company_id).company_name
-            user_data.append(user_dict)
-
-        return user_data
\ No newline at end of file
+        return (_user_row_to_dict(row) for row in users)
\ No newline at end of file
@@ -0,0 +1,60 @@
+from decimal import Decimal
+from flask.json.provider import JSONProvider
+import orjson
+
+def _default(obj):
+    """
+    Serializes types that orjson does not support natively.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        str: The string representation of the object.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_bytes(obj) -> bytes:
+    """
+    Serializes an object to JSON bytes with the app's orjson options.
+
+    Every JSON body is serialized through here, so the provider and the response helpers in
+    http_utils produce the same output. Naive datetimes are serialized as UTC.
+
+    Args:
+        obj: A JSON serializable object.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NAIVE_UTC)
+
+class ORJSONProvider(JSONProvider):
+    """
+    Flask JSON provider backed by `orjson`.
+
+    Replaces the stdlib `json` module for `jsonify`, `request.get_json` and every other
+    use of `app.json`, serializing with `dumps_bytes`.
+
+    Methods:
+        dumps(self, obj, **kwargs) -> str: Serializes an object to a JSON string.
+        loads(self, s: str | bytes, **kwargs): Deserializes a JSON string or bytes.
+        response(self, *args, **kwargs) -> Response: Creates a JSON response without decoding to str.
+    """
+    def dumps(self, obj, **kwargs) -> str:
+        """Serializes an object to a JSON string."""
+        return dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s: str | bytes, **kwargs):
+        """Deserializes a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Creates a JSON response, passing the orjson bytes to the response body directly."""
+        obj = self._prepare_response_obj(args, kwargs)
+        body = dumps_bytes(obj)
+        return self._app.response_class(body, mimetype='application/json')
@@ -0,0 +1,86 @@
+from abc import ABC, abstractmethod
+from functools import lru_cache
+import bcrypt
+
+class PasswordHasherInterface(ABC):
+    """
+    An interface for password hashing strategies.
+
+    Methods:
+        hash(self, password: str) -> str: Hashes a plain text password.
+        verify(self, password: str, pass_hash: str) -> bool: Checks a plain text password against a stored hash.
+    """
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        pass
+
+    @abstractmethod
+    def verify(self, password: str, pass_hash: str) -> bool:
+        pass
+
+class BcryptPasswordHasher(PasswordHasherInterface):
+    """
+    Password hasher backed by the `bcrypt` package (default).
+    """
+    def hash(self, password: str) -> str:
+        """Hashes a password with a freshly generated bcrypt salt."""
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+
+    def verify(self, password: str, pass_hash: str) -> bool:
+        """Checks a password against a bcrypt hash."""
+        return bcrypt.checkpw(password.encode('utf-8'), pass_hash.encode('utf-8'))
+
+class Argon2PasswordHasher(PasswordHasherInterface):
+    """
+    Password hasher backed by `argon2-cffi` (optional dependency).
+
+    Hashes created by the bcrypt hasher are still accepted by `verify`, so existing
+    users can log in after switching a deployment to argon2.
+    """
+    def __init__(self, time_cost: int = 2, memory_cost: int = 65536, parallelism: int = 4):
+        """
+        Initializes the argon2 hasher.
+
+        Args:
+            time_cost (int): Number of argon2 iterations.
+            memory_cost (int): Memory usage in KiB.
+            parallelism (int): Number of parallel lanes.
+        """
+        from argon2 import PasswordHasher
+        self._hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+        self._bcrypt_hasher = BcryptPasswordHasher()
+
+    def hash(self, password: str) -> str:
+        """Hashes a password with argon2id."""
+        return self._hasher.hash(password)
+
+    def verify(self, password: str, pass_hash: str) -> bool:
+        """Checks a password against an argon2 hash, falling back to bcrypt for legacy hashes."""
+        if pass_hash.startswith('$2'):
+            return self._bcrypt_hasher.verify(password, pass_hash)
+
+        from argon2.exceptions import VerificationError, InvalidHashError
+        try:
+            return self._hasher.verify(pass_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+@lru_cache(maxsize=None)
+def get_password_hasher(name: str) -> PasswordHasherInterface:
+    """
+    Returns the password hasher matching a configuration name.
+
+    Hashers are stateless, so one instance per name is shared by every service.
+
+    Args:
+        name (str): The hasher name ('bcrypt' or 'argon2').
+
+    Returns:
+        PasswordHasherInterface: The matching password hasher.
+    """
+    if name == 'bcrypt':
+        return BcryptPasswordHasher()
+    elif name == 'argon2':
+        return Argon2PasswordHasher()
+    else:
+        raise ValueError(f"{name} is an invalid password hasher type")
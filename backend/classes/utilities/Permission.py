@@ -1,6 +1,8 @@
 from classes.utilities.RC import RC
 from classes.utilities.RC import E_RC
 from enum import IntEnum
+from functools import wraps
+from http_utils import extract_jwt
 
 class E_PERMISSIONS(IntEnum):
     """
@@ -64,17 +66,53 @@ class E_PERMISSIONS(IntEnum):
                 return member
         return RC(E_RC.RC_INVALID_INPUT, f"Invalid permission level {value}")
     
+class PermissionMask:
+    """
+    Bitmask values for permission levels, so authorization checks are a single integer AND.
+
+    Each E_PERMISSIONS value maps to the bit `1 << value`.
+
+    Members:
+        NONE (int): Mask of an unknown permission level.
+        NET_ADMIN (int): Bit of the net_admin permission level.
+        EMPLOYER (int): Bit of the employer permission level.
+        EMPLOYEE (int): Bit of the employee permission level.
+        MANAGERS (int): Bits of net_admin and employer.
+    """
+    NONE = 0
+    NET_ADMIN = 1 << E_PERMISSIONS.net_admin.value
+    EMPLOYER = 1 << E_PERMISSIONS.employer.value
+    EMPLOYEE = 1 << E_PERMISSIONS.employee.value
+    MANAGERS = NET_ADMIN | EMPLOYER
+
+_PERMISSION_MASKS = {permission.value: 1 << permission.value for permission in E_PERMISSIONS}
+
+def permission_mask(permission) -> int:
+    """
+    Converts a permission level to its PermissionMask bit.
+
+    Args:
+        permission (E_PERMISSIONS | int): The permission level.
+
+    Returns:
+        int: The bit of the permission level, or PermissionMask.NONE if the level is unknown.
+    """
+    return _PERMISSION_MASKS.get(permission, PermissionMask.NONE)
+
 class Permission():
     """
     A class for managing and checking user permissions.
 
-    Uses the E_PERMISSIONS enum to represent different permission levels.
+    Uses the E_PERMISSIONS enum to represent different permission levels, and checks them
+    against a precomputed PermissionMask bit.
 
     Methods:
         is_net_admin(self) -> bool: Checks if the permission is net_admin.
         is_employer(self) -> bool: Checks if the permission is employer.
         is_employee(self) -> bool: Checks if the permission is employee.
     """
+    __slots__ = ('permission', 'mask')
+
     def __init__(self, permission: E_PERMISSIONS):
         """
         Initializes a Permission object.
@@ -83,17 +121,38 @@ class Permission():
             permission (E_PERMISSIONS): The permission level to assign to the object.
         """
         self.permission = permission
-    
+        self.mask = permission_mask(permission)
+
     def is_net_admin(self) -> bool:
         """Checks if the permission is net_admin."""
-        return self.permission == E_PERMISSIONS.net_admin
+        return bool(self.mask & PermissionMask.NET_ADMIN)
 
     def is_employer(self) -> bool:
         """Checks if the permission is employer."""
-
+        return bool(self.mask & PermissionMask.EMPLOYER)
 
     def is_employee(self) -> bool:
         """Checks if the permission is employee."""
-        return self.permission == E_PERMISSIONS.employee
-    
-    
\ No newline at end of file
+        return bool(self.mask & PermissionMask.EMPLOYEE)
+
+def requires(required_mask: int):
+    """
+    Decorator that rejects a request before entering the handler if the JWT permission is not in a mask.
+
+    Must be applied below `@jwt_required()`, so the token is verified first.
+
+    Args:
+        required_mask (int): The PermissionMask bits allowed to call the handler.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(*args, **kwargs):
+            user_permission = extract_jwt()[1]
+            if not (permission_mask(user_permission) & required_mask):
+                return RC(E_RC.RC_UNAUTHORIZED, "Unauthorized access").to_json()
+            return handler(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,5 +1,5 @@
 from enum import IntEnum
-from flask import jsonify
+from http_utils import json_response
 class E_RC(IntEnum):
     """
     Enum for standard return codes used in the application.
@@ -35,6 +35,8 @@ class RC:
         is_ok(self): Checks if the return code indicates success.
         to_json(self): Converts the RC object to a JSON response with appropriate HTTP status code.
     """
+    __slots__ = ('code', 'description', '_ok')
+
     def __init__(self, code: int, description: str):
         """
         Initializes an RC object.
@@ -45,6 +47,7 @@ class RC:
         """
         self.code = code
         self.description = description
+        self._ok = code in (E_RC.RC_OK, E_RC.RC_SUCCESS)
 
     def __str__(self):
         """Returns a string representation of the RC object."""
@@ -63,10 +66,7 @@ class RC:
     
     def is_ok(self):
         """Checks if the return code indicates success."""
-        if self.code == E_RC.RC_OK or self.code == E_RC.RC_SUCCESS:
-            return True
-        else:
-            return False
+        return self._ok
           
     def to_json(self):
         """
@@ -75,10 +75,5 @@ class RC:
         Includes the description as either a "message" (for success) or an "error" (for failure),
         along with the appropriate HTTP status code.
         """
-        if self.is_ok():
-            msg = "message"
-        else:
-            msg = "error"
-        
-        print(f"{msg}: {self.description}")
-        return jsonify({f"{msg}": self.description}), self.code
+        key = "message" if self._ok else "error"
+        return json_response({key: self.description}, self.code)
@@ -0,0 +1,83 @@
+from functools import lru_cache
+from config import REDIS_URL, REDIS_TIMEOUT, TOKEN_BLOCKLIST_FAIL_OPEN
+from cmn_utils import print_exception
+import time
+
+# Refresh tokens live for 30 days, so a revocation marker never needs to outlive that
+_REVOCATION_TTL = 30 * 24 * 60 * 60
+
+class TokenBlocklist:
+    """
+    Revokes JWTs per user, shared by every worker through Redis (optional dependency).
+
+    A revocation stores the time it happened under the user's key, and every token issued
+    before that time is rejected. Without a Redis URL the blocklist is disabled and
+    no token is ever revoked.
+
+    Redis calls use short timeouts. If Redis is unreachable, the error is logged and tokens are
+    accepted (fail open) or rejected (fail closed) according to TOKEN_BLOCKLIST_FAIL_OPEN, so a
+    cache outage never hangs request threads.
+
+    Methods:
+        revoke_user_tokens(self, email: str) -> None: Revokes every token issued to a user so far.
+        is_revoked(self, jwt_payload: dict) -> bool: Checks if a decoded token has been revoked.
+        _key(email: str) -> str: Returns the Redis key of a user's revocation time.
+    """
+    def __init__(self, redis_url: str = None, timeout: float = 0.2, fail_open: bool = True):
+        """
+        Initializes the blocklist.
+
+        Args:
+            redis_url (str, optional): The Redis connection URL. Defaults to None, which disables the blocklist.
+            timeout (float, optional): Connect and read timeout of Redis calls, in seconds. Defaults to 0.2.
+            fail_open (bool, optional): Whether tokens are accepted while Redis is unreachable. Defaults to True.
+        """
+        self._redis = None
+        self._fail_open = fail_open
+        if redis_url:
+            import redis
+            self._redis_error = redis.RedisError
+            self._redis = redis.Redis.from_url(redis_url, socket_timeout=timeout, socket_connect_timeout=timeout)
+
+    def revoke_user_tokens(self, email: str) -> None:
+        """Revokes every token issued to a user so far."""
+        if self._redis is None:
+            return
+
+        try:
+            self._redis.setex(self._key(email), _REVOCATION_TTL, time.time())
+        except self._redis_error as e:
+            print_exception(e)
+
+    def is_revoked(self, jwt_payload: dict) -> bool:
+        """
+        Checks if a decoded token was issued before its user's last revocation.
+
+        The revocation time keeps sub-second precision while `iat` is in whole seconds, so a token
+        issued in the same second as the revocation (e.g. right after a password change) stays valid.
+        """
+        if self._redis is None:
+            return False
+
+        try:
+            revoked_at = self._redis.get(self._key(jwt_payload['sub']))
+        except self._redis_error as e:
+            print_exception(e)
+            return not self._fail_open
+
+        return revoked_at is not None and jwt_payload.get('iat', 0) < int(float(revoked_at))
+
+    @staticmethod
+    def _key(email: str) -> str:
+        """Returns the Redis key of a user's revocation time."""
+        return f"tokens_revoked:{email}"
+
+@lru_cache(maxsize=1)
+def get_token_blocklist() -> TokenBlocklist:
+    """
+    Returns the shared TokenBlocklist instance, creating it on first use.
+
+    Returns:
+        TokenBlocklist: The shared blocklist.
+    """
+    return TokenBlocklist(REDIS_URL, REDIS_TIMEOUT, TOKEN_BLOCKLIST_FAIL_OPEN)
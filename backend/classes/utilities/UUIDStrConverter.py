@@ -0,0 +1,22 @@
+from werkzeug.routing import BaseConverter
+
+class UUIDStrConverter(BaseConverter):
+    """
+    URL converter for UUIDs that are passed on as canonical strings.
+
+    Matches only well-formed UUIDs during routing, so malformed IDs get a 404 before reaching a handler,
+    and lowercases the value so it compares equal to the IDs returned by the repositories.
+
+    Methods:
+        to_python(self, value: str) -> str: Converts the URL value to a lowercase UUID string.
+        to_url(self, value) -> str: Converts a UUID or UUID string to its URL value.
+    """
+    regex = r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+
+    def to_python(self, value: str) -> str:
+        """Converts the URL value to a lowercase UUID string."""
+        return value.lower()
+
+    def to_url(self, value) -> str:
+        """Converts a UUID or UUID string to its URL value."""
+        return str(value).lower()
@@ -6,8 +6,78 @@ from classes.domainclasses.TimeStamp import TimeStamp
 from classes.utilities.Permission import E_PERMISSIONS
 from classes.utilities.RC import RC, E_RC
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 import re
 
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+_PHONE_RE = re.compile(r"^\d{10}$")
+_VALID_REPORTING = frozenset(("work", "paidoff", "unpaidoff"))
+
+# String field rules: (attribute, required message, format message, pattern, must be non-blank, max length, max length message).
+# A None required message marks the field as optional.
+_USER_STR_RULES = (
+    ("email", "Email is required.", "Invalid email format.", _EMAIL_RE, False, 255, "Email cannot exceed 255 characters."),
+    ("first_name", "First name required.", "First name must be a non-empty string.", None, True, 255, "First Name cannot exceed 255 characters."),
+    ("last_name", "Last name required.", "Last name must be a non-empty string.", None, True, 255, "Last Name cannot exceed 255 characters."),
+    ("mobile_phone", None, "Invalid mobile phone format.", _PHONE_RE, False, None, None),
+    ("company_id", None, "Invalid company ID format.", None, False, None, None),
+    ("role", "Role is required.", "Role must be a non-empty string.", None, True, 255, "Role cannot exceed 255 characters."),
+    ("weekend_choice", None, "Invalid weekend choice format.", None, False, None, None),
+)
+
+_COMPANY_STR_RULES = (
+    ("company_name", "Company name is required.", "Company name must be a non-empty string.", None, True, 255, "Company name cannot exceed 255 characters."),
+)
+
+_TIMESTAMP_STR_RULES = (
+    ("user_email", "User email is required.", "Invalid user email format.", _EMAIL_RE, False, 255, "User email cannot exceed 255 characters."),
+    ("entered_by", "Entered by is required.", "Invalid entered by email format.", _EMAIL_RE, False, 255, "Entered by email cannot exceed 255 characters."),
+    ("detail", None, "Detail must be a non-empty string.", None, True, 255, "Timestamp Details cannot exceed 255 characters."),
+    ("reporting_type", "Reporting type is required.", "Reporting type must be a non-empty string. Valid Values are [work, paidoff, unpaidoff]", None, True, None, None),
+)
+
+def _check_str(value, required_msg, format_msg, pattern, non_blank, max_len, max_len_msg) -> str | None:
+    """
+    Checks a single string field against one rule.
+
+    Returns:
+        str | None: The error message of the first failed check, or None if the value is valid.
+    """
+    if not value:
+        return required_msg
+    if not isinstance(value, str):
+        return format_msg
+    # Length is O(1) for str, so check it before the O(n) strip and regex scans
+    if max_len and len(value) > max_len:
+        return max_len_msg
+    if (non_blank and not value.strip()) or (pattern and not pattern.match(value)):
+        return format_msg
+    return None
+
+def _compile_str_rules(rules) -> tuple:
+    """
+    Compiles a string rule table once into (attribute getter, rule arguments) pairs.
+
+    Returns:
+        tuple: The compiled rules, ready for `_check_str_rules`.
+    """
+    return tuple((attrgetter(attr), tuple(rule)) for attr, *rule in rules)
+
+def _check_str_rules(obj, compiled_rules) -> str | None:
+    """
+    Runs compiled string field rules against an object, returning the first error message found.
+    """
+    for get_value, rule in compiled_rules:
+        error = _check_str(get_value(obj), *rule)
+        if error:
+            return error
+    return None
+
+_USER_STR_CHECKS = _compile_str_rules(_USER_STR_RULES)
+_COMPANY_STR_CHECKS = _compile_str_rules(_COMPANY_STR_RULES)
+_TIMESTAMP_STR_CHECKS = _compile_str_rules(_TIMESTAMP_STR_RULES)
+
 class ModelValidator(ValidatorInterface):
     """
     Validator class for domain models.
@@ -22,6 +92,16 @@ class ModelValidator(ValidatorInterface):
         _validate_company(self, company: Company) -> RC: Validates a Company object.
         _validate_timestamp(self, timestamp: TimeStamp) -> RC: Validates a TimeStamp object.
     """
+    def __init__(self):
+        """
+        Initializes the ModelValidator and its type to validation method dispatch table.
+        """
+        self._dispatch = {
+            User: self._validate_user,
+            Company: self._validate_company,
+            TimeStamp: self._validate_timestamp,
+        }
+
     def validate(self, obj: DomainClassInterface) -> RC:
         """
         Validates a given domain object.
@@ -34,15 +114,12 @@ class ModelValidator(ValidatorInterface):
         Returns:
             RC: An RC object indicating the validation result.
         """
-        if isinstance(obj, User):
-            return self._validate_user(obj)
-        elif isinstance(obj, Company):
-            return self._validate_company(obj)
-        elif isinstance(obj, TimeStamp):
-            return self._validate_timestamp(obj)
-        else:
+        validate_fn = self._dispatch.get(type(obj))
+        if validate_fn is None:
             return RC(E_RC.RC_INVALID_INPUT, "Unsupported object type for validation")
 
+        return validate_fn(obj)
+
     def _validate_user(self, user: User) -> RC:
         """
         Validates a User object.
@@ -56,37 +133,14 @@ class ModelValidator(ValidatorInterface):
         Returns:
             RC: An RC object indicating the validation result.
         """
-        if not user.email:
-            return RC(E_RC.RC_INVALID_INPUT, "Email is required.")
-        if not isinstance(user.email, str) or not re.match(r"[^@]+@[^@]+\.[^@]+", user.email):
-            return RC(E_RC.RC_INVALID_INPUT, "Invalid email format.")
-
-        if not user.first_name:
-            return RC(E_RC.RC_INVALID_INPUT, "First name required.")
-        if not user.last_name:
-            return RC(E_RC.RC_INVALID_INPUT, "Last name required.")
-        if not isinstance(user.first_name, str) or not user.first_name.strip():
-            return RC(E_RC.RC_INVALID_INPUT, "First name must be a non-empty string.")
-        if not isinstance(user.last_name, str) or not user.last_name.strip():
-            return RC(E_RC.RC_INVALID_INPUT, "Last name must be a non-empty string.")
-        if len(user.first_name) > 255:  
-            return RC(E_RC.RC_INVALID_INPUT, "First Name cannot exceed 255 characters.")
-        if len(user.last_name) > 255:  
-            return RC(E_RC.RC_INVALID_INPUT, "Last Name cannot exceed 255 characters.")
-
-        if user.mobile_phone:
-            if not isinstance(user.mobile_phone, str) or not re.match(r"^\d{10}$", user.mobile_phone):  
-                return RC(E_RC.RC_INVALID_INPUT, "Invalid mobile phone format.")
-
-        if user.company_id and not isinstance(user.company_id, str): 
-            return RC(E_RC.RC_INVALID_INPUT, "Invalid company ID format.")
-
-        if not user.role:
-            return RC(E_RC.RC_INVALID_INPUT, "Role is required.")
-        if not isinstance(user.role, str) or not user.role.strip():
-            return RC(E_RC.RC_INVALID_INPUT, "Role must be a non-empty string.")
-        if len(user.role) > 255:  
-            return RC(E_RC.RC_INVALID_INPUT, "Role cannot exceed 255 characters.")
+        error = _check_str_rules(user, _USER_STR_CHECKS)
+        if error:
+            return RC(E_RC.RC_INVALID_INPUT, error)
+
+        salary = user.salary
+        work_capacity = user.work_capacity
+        employment_start = user.employment_start
+        employment_end = user.employment_end
 
         try:
             E_PERMISSIONS(user.permission)  
@@ -96,22 +150,19 @@ class ModelValidator(ValidatorInterface):
         if not isinstance(user.is_active, bool):
             return RC(E_RC.RC_INVALID_INPUT, "is_active must be a boolean value (True/False).")
 
-        if not isinstance(user.salary, (int, float)) or user.salary < 0:
+        if type(salary) not in (int, float) or salary < 0:
             return RC(E_RC.RC_INVALID_INPUT, "Invalid salary value. Must be a positive number")
 
-        if not isinstance(user.work_capacity, (int, float)) or user.work_capacity < 0 or user.work_capacity > 24:
+        if type(work_capacity) not in (int, float) or work_capacity < 0 or work_capacity > 24:
             return RC(E_RC.RC_INVALID_INPUT, "Invalid work capacity value. Value must be a number between 0 and 24")
 
-        if not isinstance(user.employment_start, datetime):
+        if not isinstance(employment_start, datetime):
             return RC(E_RC.RC_INVALID_INPUT, "Invalid employment start date.")
-        if user.employment_end and not isinstance(user.employment_end, datetime):
+        if employment_end and not isinstance(employment_end, datetime):
             return RC(E_RC.RC_INVALID_INPUT, "Invalid employment end date.")
-        if user.employment_end and user.employment_end < user.employment_start:
+        if employment_end and employment_end < employment_start:
             return RC(E_RC.RC_INVALID_INPUT, "Employment end date cannot be before the start date.")
 
-        if user.weekend_choice and not isinstance(user.weekend_choice, str):
-            return RC(E_RC.RC_INVALID_INPUT, "Invalid weekend choice format.")
-
         return RC(E_RC.RC_OK, "User Validation Succesfull")
 
     def _validate_company(self, company: Company) -> RC:
@@ -126,14 +177,9 @@ class ModelValidator(ValidatorInterface):
         Returns:
             RC: An RC object indicating the validation result.
         """
-        if not company.company_name:
-            return RC(E_RC.RC_INVALID_INPUT, "Company name is required.")
-        
-        if not isinstance(company.company_name, str) or not company.company_name.strip():
-            return RC(E_RC.RC_INVALID_INPUT, "Company name must be a non-empty string.")
-        
-        if len(company.company_name) > 255:  
-            return RC(E_RC.RC_INVALID_INPUT, "Company name cannot exceed 255 characters.")
+        error = _check_str_rules(company, _COMPANY_STR_CHECKS)
+        if error:
+            return RC(E_RC.RC_INVALID_INPUT, error)
         
         if not isinstance(company.is_active, bool):
             return RC(E_RC.RC_INVALID_INPUT, "is_active must be a boolean value (True/False).")
@@ -153,39 +199,38 @@ class ModelValidator(ValidatorInterface):
         Returns:
             RC: An RC object indicating the validation result.
         """
-        if not timestamp.user_email:
-            return RC(E_RC.RC_INVALID_INPUT, "User email is required.")
-        if not isinstance(timestamp.user_email, str) or not re.match(r"[^@]+@[^@]+\.[^@]+", timestamp.user_email):
-            return RC(E_RC.RC_INVALID_INPUT, "Invalid user email format.")
+        error = _check_str_rules(timestamp, _TIMESTAMP_STR_CHECKS)
+        if error:
+            return RC(E_RC.RC_INVALID_INPUT, error)
+        if timestamp.reporting_type not in _VALID_REPORTING:
+            return RC(E_RC.RC_INVALID_INPUT, "Reporting type must be a non-empty string. Valid Values are [work, paidoff, unpaidoff]")
 
-        if not timestamp.entered_by:
-            return RC(E_RC.RC_INVALID_INPUT, "Entered by is required.")
-        if not isinstance(timestamp.entered_by, str) or not re.match(r"[^@]+@[^@]+\.[^@]+", timestamp.entered_by):
-            return RC(E_RC.RC_INVALID_INPUT, "Invalid entered by email format.")
+        punch_type = timestamp.punch_type
+        punch_in = timestamp.punch_in_timestamp
+        punch_out = timestamp.punch_out_timestamp
 
-        if not isinstance(timestamp.punch_type, int) or timestamp.punch_type < 0 or timestamp.punch_type > 3:
+        if type(punch_type) is not int or punch_type < 0 or punch_type > 3:
             return RC(E_RC.RC_INVALID_INPUT, "Invalid punch type.")
 
-        if not timestamp.punch_in_timestamp:
+        if not punch_in:
             return RC(E_RC.RC_INVALID_INPUT, "Punch in timestamp is required.")
-        if not isinstance(timestamp.punch_in_timestamp, datetime):
+        if not isinstance(punch_in, datetime):
             return RC(E_RC.RC_INVALID_INPUT, "Invalid punch in timestamp format.")
 
-        if timestamp.punch_out_timestamp and not isinstance(timestamp.punch_out_timestamp, datetime):
+        if punch_out and not isinstance(punch_out, datetime):
             return RC(E_RC.RC_INVALID_INPUT, "Invalid punch out timestamp format.")
 
-        if timestamp.punch_out_timestamp and timestamp.punch_out_timestamp < timestamp.punch_in_timestamp:
+        if punch_out and punch_out < punch_in:
             return RC(E_RC.RC_INVALID_INPUT, "Punch out timestamp cannot be before punch in timestamp.")
 
-        if timestamp.detail:
-            if not isinstance(timestamp.detail, str) or not timestamp.detail.strip():
-                return RC(E_RC.RC_INVALID_INPUT, "Detail must be a non-empty string.")
-            if timestamp.detail and len(timestamp.detail) > 255:  
-                return RC(E_RC.RC_INVALID_INPUT, "Timestamp Details cannot exceed 255 characters.")
+        return RC(E_RC.RC_OK, "Timestamp Validation Succesfull")
 
-        if not timestamp.reporting_type:
-            return RC(E_RC.RC_INVALID_INPUT, "Reporting type is required.")
-        if not isinstance(timestamp.reporting_type, str) or not timestamp.reporting_type.strip() and timestamp.reporting_type not in ["work, paidoff, unpaidoff"]:
-            return RC(E_RC.RC_INVALID_INPUT, "Reporting type must be a non-empty string. Valid Values are [work, paidoff, unpaidoff]")
+@lru_cache(maxsize=1)
+def get_model_validator() -> ModelValidator:
+    """
+    Returns the shared ModelValidator instance, creating it on first use.
 
-        return RC(E_RC.RC_OK, "Timestamp Validation Succesfull")
\ No newline at end of file
+    Returns:
+        ModelValidator: The shared validator.
+    """
+    return ModelValidator()
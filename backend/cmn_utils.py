@@ -1,39 +1,106 @@
 import traceback
-from tabulate import tabulate
+import logging
+import atexit
+import os
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from functools import lru_cache
 import datetime
-import re
-from datetime import datetime, timezone, timedelta
-import psycopg2
-from flask_jwt_extended import get_jwt_identity, get_jwt
-from config import *
+from datetime import datetime, timezone
+import calendar
+
+__all__ = [
+    'WEEKDAY_INDEX', 'print_exception', 'find_timewatch_re', 'parse_weekend_choice', 'count_work_days', 'resolve_date_range',
+    'calculate_work_capacity', 'format_hours_to_hhmm', 'iso2datetime', 'datetime2iso',
+]
+
+_PATH_NEEDLES = ("backend", "timeWatch", "tw", "tt")
+WEEKDAY_INDEX = {name: idx for idx, name in enumerate(("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"))}
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that enqueues records unformatted, so traceback formatting happens on the listener thread.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+class _ExceptionLineFormatter(logging.Formatter):
+    """
+    Formats an exception record as a single line: timestamp | type | message | filename | line number.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        exception = record.exc_info[1]
+        tb = traceback.extract_tb(exception.__traceback__)[-1]
+        timestamp = datetime.fromtimestamp(record.created).strftime("%d-%m-%Y %H:%M:%S")
+        filename = tb.filename
+        path_idx = find_timewatch_re(filename)
+        if -1 != path_idx:
+            filename = filename[path_idx:]
+
+        return f"{timestamp} | {type(exception).__name__} | {exception} | {filename} | {tb.lineno}"
+
+def _start_exception_logger(logger: logging.Logger) -> None:
+    """
+    Attaches a queue handler to the exception logger, whose records are written to stdout by a background QueueListener.
+
+    Handlers left over from a parent process are replaced, since their listener thread does not survive a fork.
+
+    Args:
+        logger (logging.Logger): The exception logger.
+    """
+    log_queue = SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_ExceptionLineFormatter())
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.setLevel(logging.ERROR)
+    logger.propagate = False
+    logger.handlers.clear()
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+
+def _get_exception_logger() -> logging.Logger:
+    """
+    Returns the exception logger, starting its listener thread on first use in the current process.
+
+    The listener is started lazily instead of at import time, so worker processes forked from a
+    preloaded app (gunicorn `preload_app`) start their own listener instead of logging into a dead one.
+
+    Returns:
+        logging.Logger: The exception logger.
+    """
+    global _exception_logger_pid
+    pid = os.getpid()
+    if _exception_logger_pid != pid:
+        with _EXCEPTION_LOGGER_LOCK:
+            if _exception_logger_pid != pid:
+                _start_exception_logger(_EXCEPTION_LOGGER)
+                _exception_logger_pid = pid
+    return _EXCEPTION_LOGGER
+
+_EXCEPTION_LOGGER = logging.getLogger('timetracker.exceptions')
+_EXCEPTION_LOGGER_LOCK = threading.Lock()
+_exception_logger_pid = None
 
 def print_exception(exception)-> None:
     """Prints a formatted exception message with relevant details.
 
-    The exception message is formatted into a table with the following columns:
+    The exception message is printed as a single line with the following fields:
     - Timestamp
     - Exception Type
     - Exception Message
     - Filename
     - Line Number
 
+    The exception is queued and formatted by a background thread, so the caller does not pay for the traceback walk.
+
     Args:
         exception: The exception object.
     """
-
-    tb = traceback.extract_tb(exception.__traceback__)[-1]
-    exception_type = type(exception).__name__
-    exception_message = str(exception)
-    timestamp = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-    path_idx = find_timewatch_re(tb.filename)
-    if -1 != path_idx:
-        tb.filename = tb.filename[path_idx:]
-
-    table_data = [
-        [timestamp, "|", exception_type, "|", exception_message, "|", tb.filename, "|", tb.lineno]
-    ]
-
-    print(tabulate(table_data, tablefmt="simple", numalign="left", stralign="left"))
+    _get_exception_logger().error('', exc_info=(type(exception), exception, exception.__traceback__))
 
 def find_timewatch_re(string)->int:
     """
@@ -45,50 +112,107 @@ def find_timewatch_re(string)->int:
     Returns:
         int: The starting index of "timeWatch" or "tw" if found, -1 otherwise.
     """
-    match = re.search(r"backend", string)
-    if not match:
-        match = re.search(r"timeWatch", string)
-    if not match:
-        match = re.search(r"tw", string)
-    if not match:
-        match = re.search(r"tt", string)
+    for needle in _PATH_NEEDLES:
+        idx = string.find(needle)
+        if -1 != idx:
+            return idx
 
-    return match.start() if match else -1
+    return -1
 
-def get_db_connection(config: dict):
+def parse_weekend_choice(weekend_choice: str) -> frozenset:
     """
-    Establishes a connection to the PostgreSQL database.
+    Converts a comma separated list of weekday names to weekday indices.
 
     Args:
-        config (dict): A dictionary containing database configuration parameters.
+        weekend_choice (str): Weekday names, e.g. "Friday,Saturday". May be None.
 
     Returns:
-        psycopg2.connection: A database connection object.
+        frozenset: The weekday indices (Monday is 0) of the weekend days.
     """
-    conn = psycopg2.connect(
-        host=config['DB_HOST'],
-        database=config['DB_NAME'],
-        user=config['DB_USER'],
-        password=config['DB_PASSWORD']
-    )
-    return conn
+    if not weekend_choice:
+        return frozenset()
+
+    return frozenset(WEEKDAY_INDEX[day] for day in map(str.lower, map(str.strip, weekend_choice.split(','))) if day in WEEKDAY_INDEX)
 
-def extract_jwt() -> tuple:
+@lru_cache(maxsize=1024)
+def count_work_days(first_weekday: int, total_days: int, weekend_days: frozenset) -> int:
     """
-    Extracts user information from the JWT token.
+    Counts the non-weekend days in a range of consecutive days.
+
+    Results are cached, since report generation asks for the same range and weekend for many users.
+
+    Args:
+        first_weekday (int): The weekday index (Monday is 0) of the first day in the range.
+        total_days (int): The number of days in the range.
+        weekend_days (frozenset): The weekday indices of the weekend days.
 
     Returns:
-        tuple: A tuple containing the user's email, permission level, and company ID.
+        int: The number of work days in the range.
     """
-    current_user_email = get_jwt_identity()
-    claims = get_jwt()
-    user_permission = claims.get('permission') 
-    user_company_id = claims.get('company_id') 
-    
-    return current_user_email, user_permission, user_company_id
+    full_weeks, extra_days = divmod(total_days, 7)
+    num_work_days = 0
+    for weekday in range(7):
+        if weekday not in weekend_days:
+            num_work_days += full_weeks + (1 if (weekday - first_weekday) % 7 < extra_days else 0)
+
+    return num_work_days
+
+def _monthly_range(selected_year: str, selected_month: str, start_date_str: str, end_date_str: str) -> tuple:
+    """Returns the first and last day of the selected month."""
+    if not selected_year or not selected_month:
+        raise ValueError('Year and month are required for monthly reports')
+
+    try:
+        year = int(selected_year)
+        month = int(selected_month)
+    except ValueError:
+        raise ValueError('Year and month must be numbers')
+
+    start_date = datetime(year, month, 1, tzinfo=timezone.utc)
+    end_date = datetime(year, month, calendar.monthrange(year, month)[1], tzinfo=timezone.utc)
+    return start_date, end_date
+
+def _custom_range(selected_year: str, selected_month: str, start_date_str: str, end_date_str: str) -> tuple:
+    """Returns the parsed start and end dates of a custom range."""
+    if not start_date_str or not end_date_str:
+        raise ValueError('Start and end dates are required for custom reports')
+    try:
+        start_date = iso2datetime(start_date_str)
+        end_date = iso2datetime(end_date_str)
+    except ValueError:
+        raise ValueError('Invalid date format')
+
+    if end_date < start_date:
+        raise ValueError('Start date must earlier than end date')
+    return start_date, end_date
 
+_DATE_RANGE_RESOLVERS = {
+    'monthly': _monthly_range,
+    'custom': _custom_range,
+}
+
+def resolve_date_range(date_range_type: str, selected_year: str, selected_month: str, start_date_str: str, end_date_str: str) -> tuple:
+    """
+    Resolves report query parameters to a start and end date.
+
+    Args:
+        date_range_type (str): The type of date range selection ('monthly' or 'custom').
+        selected_year (str): The year selected for the report (if date_range_type is 'monthly').
+        selected_month (str): The month selected for the report (if date_range_type is 'monthly').
+        start_date_str (str): The start date of the custom date range (if date_range_type is 'custom').
+        end_date_str (str): The end date of the custom date range (if date_range_type is 'custom').
+
+    Returns:
+        tuple: The start_date and end_date as UTC datetime objects.
+
+    Raises:
+        ValueError: If the date range type is unknown or the parameters are missing or invalid.
+    """
+    resolver = _DATE_RANGE_RESOLVERS.get(date_range_type)
+    if resolver is None:
+        raise ValueError('Invalid date range type')
+    return resolver(selected_year, selected_month, start_date_str, end_date_str)
 
-        
 def calculate_work_capacity(user, start_date, end_date) -> float:
     """
     Calculates the total work capacity for a user within a given date range.
@@ -103,12 +227,11 @@ def calculate_work_capacity(user, start_date, end_date) -> float:
     Returns:
         float: The total work capacity in hours, rounded to 2 decimal places.
     """
-    num_work_days = 0
-    current_date = start_date
-    while current_date <= end_date:
-        if not user.weekend_choice or current_date.strftime('%A').lower() not in map(str.lower, user.weekend_choice.split(',')):
-            num_work_days += 1
-        current_date += timedelta(days=1)
+    total_days = (end_date - start_date).days + 1
+    if total_days <= 0:
+        return 0.0
+
+    num_work_days = count_work_days(start_date.weekday(), total_days, parse_weekend_choice(user.weekend_choice))
 
     daily_work_capacity = float(user.work_capacity or 0)
     total_work_capacity = daily_work_capacity * num_work_days
@@ -129,21 +252,25 @@ def format_hours_to_hhmm(seconds) -> str:
     minutes = int((seconds % 3600) // 60)
     return f"{hours:02d}:{minutes:02d}"
 
-def iso2datetime(iso_str: str) -> str:
+def iso2datetime(iso_str: str) -> datetime|None:
     """
     Converts an ISO formatted string to a datetime object in UTC timezone.
 
+    Strings without an offset are treated as UTC, strings with an offset are converted to UTC.
+
     Args:
         iso_str (str): The ISO formatted string.
 
     Returns:
         datetime: The datetime object in UTC timezone.
     """
-    date_time_obj : datetime=  datetime.fromisoformat(iso_str.replace('Z', '+00:00')) if iso_str else None
-    if date_time_obj:
+    if not iso_str:
+        return None
+
+    date_time_obj: datetime = datetime.fromisoformat(iso_str)
+    if date_time_obj.tzinfo is None:
         return date_time_obj.replace(tzinfo=timezone.utc)
-    else:
-        return date_time_obj
+    return date_time_obj.astimezone(timezone.utc)
     
 def datetime2iso(date_time: datetime) -> str|None:
     """
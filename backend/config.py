@@ -17,6 +17,14 @@ class Config:
         DB_PASSWORD (str): Password for database connection.
         WEB_URL (str): URL of the web application.
         WEB_PORT (str): Port number of the web application.
+        PASSWORD_HASHER (str): Password hashing algorithm ('bcrypt' or 'argon2').
+        REDIS_URL (str): Redis URL of the shared token blocklist. Empty disables token revocation.
+        REDIS_TIMEOUT (float): Connect and read timeout of token blocklist Redis calls, in seconds.
+        TOKEN_BLOCKLIST_FAIL_OPEN (bool): Whether tokens are accepted while Redis is unreachable.
+        DB_POOL_SIZE (int): Number of connections kept open in the SQLAlchemy pool of each worker. Defaults to GUNICORN_THREADS.
+        DB_MAX_OVERFLOW (int): Number of extra connections the pool may open under load.
+        SQLALCHEMY_ENGINE_OPTIONS (dict): Engine options passed to Flask-SQLAlchemy.
+        COMPRESS_* : Flask-Compress settings. Streamed responses are compressed separately in http_utils.
     """
     JWT_SECRET_KEY  = os.getenv('JWT_SECRET', 'your_jwt_secret_key')
     DB_HOST = os.getenv('DB_HOST', 'localhost')
@@ -26,4 +34,41 @@ class Config:
     DB_PASSWORD = os.getenv('DB_PASS', 'pass')
 
     WEB_URL = os.getenv('WEB_URL', 'localhost')
-    WEB_PORT = os.getenv('WEB_PORT', '5173')
\ No newline at end of file
+    WEB_PORT = os.getenv('WEB_PORT', '5173')
+
+    PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'bcrypt')
+    REDIS_URL = os.getenv('REDIS_URL', '')
+    REDIS_TIMEOUT = float(os.getenv('REDIS_TIMEOUT', '0.2'))
+    TOKEN_BLOCKLIST_FAIL_OPEN = os.getenv('TOKEN_BLOCKLIST_FAIL_OPEN', 'true').lower() == 'true'
+
+    # One pooled connection per gunicorn thread, plus a small overflow
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', os.getenv('GUNICORN_THREADS', '8')))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '2'))
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
+        'pool_pre_ping': True,
+        'pool_recycle': 300,
+    }
+
+    COMPRESS_ALGORITHM = ['zstd', 'br', 'gzip']
+    COMPRESS_LEVEL = 4
+    COMPRESS_BR_LEVEL = 4
+    COMPRESS_ZSTD_LEVEL = 3
+    COMPRESS_MIN_SIZE = 1024
+    COMPRESS_STREAMS = False
+
+JWT_SECRET_KEY = Config.JWT_SECRET_KEY
+DB_HOST = Config.DB_HOST
+DB_PORT = Config.DB_PORT
+DB_NAME = Config.DB_NAME
+DB_USER = Config.DB_USER
+DB_PASSWORD = Config.DB_PASSWORD
+WEB_URL = Config.WEB_URL
+WEB_PORT = Config.WEB_PORT
+PASSWORD_HASHER = Config.PASSWORD_HASHER
+REDIS_URL = Config.REDIS_URL
+REDIS_TIMEOUT = Config.REDIS_TIMEOUT
+TOKEN_BLOCKLIST_FAIL_OPEN = Config.TOKEN_BLOCKLIST_FAIL_OPEN
+DB_POOL_SIZE = Config.DB_POOL_SIZE
+DB_MAX_OVERFLOW = Config.DB_MAX_OVERFLOW
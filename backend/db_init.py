@@ -1,7 +1,7 @@
-from models import CompanyModel, UserModel
+from models import CompanyModel, UserModel, TimeStampModel
 from sqlalchemy import text  
 from sqlalchemy_utils import database_exists, create_database
-from config import *
+from config import DB_NAME
 import bcrypt
 from datetime import datetime, timezone
 from classes.utilities.Permission import E_PERMISSIONS
@@ -26,69 +26,84 @@ def create_db(app, db):
     """
     db_uri = app.config['SQLALCHEMY_DATABASE_URI']
     if not database_exists(db_uri):
-        print(f"Database '{Config.DB_NAME}' not found. Creating...")
+        print(f"Database '{DB_NAME}' not found. Creating...")
         create_database(db_uri)  
-        print(f"Database '{Config.DB_NAME}' created successfully.")
+        print(f"Database '{DB_NAME}' created successfully.")
+
+    # All seed users share the same password, so hash it only once
+    default_pass_hash = bcrypt.hashpw('123'.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    now = datetime.now(timezone.utc)
 
     with app.app_context():
         engine = db.get_engine()
 
-        with engine.connect() as conn:
+        with engine.begin() as conn:
             conn.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";'))
-            conn.commit()  
-
-        db.create_all()  
+            db.metadata.create_all(bind=conn)
+            # create_all only adds indexes with new tables, so add them explicitly to existing ones
+            for model in (UserModel, TimeStampModel):
+                for index in model.__table__.indexes:
+                    index.create(bind=conn, checkfirst=True)
         print("Tables created successfully.")
 
-        if not CompanyModel.query.filter_by(company_name="NetAdmin Company").first():
+        new_companies = []
+        new_users = []
+
+        company_names = ['tlv300', 'test1']
+        existing_companies = {
+            company.company_name: company
+            for company in CompanyModel.query.filter(CompanyModel.company_name.in_(["NetAdmin Company", *company_names])).all()
+        }
+
+        net_admin_company: CompanyModel = existing_companies.get("NetAdmin Company")
+        if not net_admin_company:
             print("Creating NetAdmin company...")
-            company = CompanyModel(company_name="NetAdmin Company")
-            db.session.add(company)
-            db.session.commit()
-            print("NetAdmin company created successfully.")
+            net_admin_company = CompanyModel(company_name="NetAdmin Company")
+            new_companies.append(net_admin_company)
         else:
             print("NetAdmin company already exists.")
 
-        if not UserModel.query.filter_by(email='a@gmail.com').first():
-            print("Creating net admin user...")
+        ############ create test data #####################
+        companies = []
+        for company_name in company_names:
+            company = existing_companies.get(company_name)
+            if not company:
+                company = CompanyModel(company_name=company_name)
+                new_companies.append(company)
+                companies.append(company)
 
-            company: CompanyModel = CompanyModel.query.filter_by(company_name="NetAdmin Company").first()
+        # Flush the companies first so their generated ids can be referenced by the users
+        db.session.add_all(new_companies)
+        db.session.flush()
+
+        user_emails = ['a@gmail.com']
+        for company in companies:
+            user_emails += [f'employer@{company.company_name}.com', f'employee@{company.company_name}.com']
+        existing_emails = {email for (email,) in db.session.query(UserModel.email).filter(UserModel.email.in_(user_emails)).all()}
+
+        if 'a@gmail.com' not in existing_emails:
+            print("Creating net admin user...")
 
             net_admin = UserModel(
                 email='a@gmail.com',
                 first_name='Net',
                 last_name='Admin',
-                company_id=company.company_id,  
+                company_id=net_admin_company.company_id,  
                 role='Net Admin',
                 permission=E_PERMISSIONS.net_admin,  
-                pass_hash=bcrypt.hashpw('123'.encode('utf-8'), bcrypt.gensalt()).decode('utf-8'),
+                pass_hash=default_pass_hash,
                 is_active=True,
                 salary = 1,
                 work_capacity = 9,
-                employment_start = datetime.now(timezone.utc),
+                employment_start = now,
                 weekend_choice = "Friday,Saturday"
             )
-            db.session.add(net_admin)
-            db.session.commit()
-            print("Net admin user created successfully.")
+            new_users.append(net_admin)
         else:
             print("Net admin user already exists.")
 
-        ############ create test data #####################
-        company_names = ['tlv300', 'test1']
-        companies = []
-        for company_name in company_names:
-            company = CompanyModel.query.filter_by(company_name=company_name).first()
-            if not company:
-                company = CompanyModel(company_name=company_name)
-                db.session.add(company)
-                companies.append(company)
-                print(f"{company_name} created successfully.")
-        db.session.commit()
-
         for company in companies:
-            employer: UserModel = UserModel.query.filter_by(email=f'{company.company_name}_employer@example.com').first()
-            if not employer:
+            if f'employer@{company.company_name}.com' not in existing_emails:
                 employer = UserModel(
                     email=f'employer@{company.company_name}.com',
                     first_name='Employer',
@@ -97,18 +112,16 @@ def create_db(app, db):
                     company_id=company.company_id,
                     role='Manager',
                     permission=E_PERMISSIONS.employer, 
-                    pass_hash=bcrypt.hashpw('123'.encode('utf-8'), bcrypt.gensalt()).decode('utf-8'),
+                    pass_hash=default_pass_hash,
                     is_active=True,
                     salary = random.randint(1, 50) ,
                     work_capacity = random.randint(1, 9) ,
-                    employment_start = datetime.now(timezone.utc),
+                    employment_start = now,
                     weekend_choice = "Friday,Saturday"
                     )
-                db.session.add(employer) 
-                print(f"{company.company_name} employer created successfully.")
+                new_users.append(employer)
 
-            employee: UserModel = UserModel.query.filter_by(email=f'{company.company_name}_employee@example.com').first()
-            if not employee:
+            if f'employee@{company.company_name}.com' not in existing_emails:
                 employee = UserModel(
                     email=f'employee@{company.company_name}.com',
                     first_name='Employee',
@@ -117,15 +130,26 @@ def create_db(app, db):
                     company_id=company.company_id,
                     role='secretary',
                     permission=E_PERMISSIONS.employee,  
-                    pass_hash=bcrypt.hashpw('123'.encode('utf-8'), bcrypt.gensalt()).decode('utf-8'),
+                    pass_hash=default_pass_hash,
                     is_active=True,
                     salary = random.randint(1, 50) ,
                     work_capacity = random.randint(1, 9) ,
-                    employment_start = datetime.now(timezone.utc),
+                    employment_start = now,
                     weekend_choice = "Saturday,Sunday"
                 )
-                db.session.add(employee)
-                print(f"{company.company_name} employee created successfully.")
-            db.session.commit()
+                new_users.append(employee)
+
+        created = [company.company_name for company in new_companies] + [user.email for user in new_users]
+        db.session.bulk_save_objects(new_users)
+        db.session.commit()
+
+        for name in created:
+            print(f"{name} created successfully.")
+
+        engine.dispose()
 
-        engine.dispose()
\ No newline at end of file
+if __name__ == '__main__':
+    # Stand-alone initialization, for deployments where gunicorn serves main:app and main.py never runs as a script
+    from main import app
+    from models import db
+    create_db(app, db)
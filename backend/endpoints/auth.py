@@ -1,17 +1,28 @@
-from flask import Blueprint, request, jsonify
+from functools import lru_cache
+from flask import Blueprint
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models import db
 from classes.utilities.RC import RC
 from classes.repositories.UserRepository import UserRepository
 from classes.services.AuthService import AuthService
-from classes.validators.ModelValidator import ModelValidator
-from classes.factories.DomainClassFactory import DomainClassFactory
+from classes.validators.ModelValidator import get_model_validator
+from classes.factories.DomainClassFactory import get_domain_class_factory
 from classes.utilities.RC import E_RC
-from cmn_utils import *
+from classes.utilities.PasswordHasher import get_password_hasher
+from http_utils import request_json, json_response
+from config import PASSWORD_HASHER
 
 
 auth_blueprint = Blueprint('auth', __name__)
-auth_service: AuthService = AuthService(UserRepository(db), ModelValidator(), DomainClassFactory())  
+@lru_cache(maxsize=1)
+def get_auth_service() -> AuthService:
+    """
+    Returns the authentication service, creating it on first use instead of at import time.
+
+    Returns:
+        AuthService: The shared AuthService instance.
+    """
+    return AuthService(UserRepository(db), get_model_validator(), get_domain_class_factory(), get_password_hasher(PASSWORD_HASHER))
 
 @auth_blueprint.route('/login', methods=['POST'])
 def login():
@@ -24,25 +35,20 @@ def login():
     Returns:
         tuple: A JSON response with tokens and user information, along with an HTTP status code.
     """
-    try:
-        data = request.get_json()
-        email = data.get('email')
-        password = data.get('password')
-        
-        response: dict = auth_service.login(email, password)
-        if isinstance(response, RC):
-           return response.to_json()
+    data = request_json()
+    email = data.get('email')
+    password = data.get('password')
     
-        return jsonify({
-            'access_token': response["access_token"], 
-            'refresh_token': response["refresh_token"],
-            'permission': response["permission"],
-            'company_id': response["company_id"]
-        }), E_RC.RC_OK
+    response: dict = get_auth_service().login(email, password)
+    if isinstance(response, RC):
+       return response.to_json()
 
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
+    return json_response({
+        'access_token': response["access_token"], 
+        'refresh_token': response["refresh_token"],
+        'permission': response["permission"],
+        'company_id': response["company_id"]
+    }, E_RC.RC_OK)
 
 @auth_blueprint.route('/refresh', methods=['POST'])
 @jwt_required(refresh=True)
@@ -56,18 +62,13 @@ def refresh():
     Returns:
         tuple: A JSON response with new tokens, along with an HTTP status code.
     """
-    try:
-        current_user = get_jwt_identity()
-        
-        response = auth_service.refresh(current_user)
-        if isinstance(response, RC):
-            return response.to_json()
-        
-        return jsonify({
-            'access_token': response["new_access_token"], 
-            'refresh_token': response["new_refresh_token"]
-            }), E_RC.RC_OK
+    current_user = get_jwt_identity()
+    
+    response = get_auth_service().refresh(current_user)
+    if isinstance(response, RC):
+        return response.to_json()
     
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
\ No newline at end of file
+    return json_response({
+        'access_token': response["new_access_token"], 
+        'refresh_token': response["new_refresh_token"]
+        }, E_RC.RC_OK)
\ No newline at end of file
@@ -1,18 +1,49 @@
-from flask import Blueprint, request, jsonify
+from functools import lru_cache
+from flask import Blueprint, request
 from models import db  
 from classes.repositories import CompanyRepository
 from classes.services.CompanyService import CompanyService
-from classes.validators.ModelValidator import ModelValidator
-from classes.factories.DomainClassFactory import DomainClassFactory
+from classes.validators.ModelValidator import get_model_validator
+from classes.factories.DomainClassFactory import get_domain_class_factory
+from classes.utilities.Permission import PermissionMask, requires
 from classes.utilities.RC import RC, E_RC
-from cmn_utils import *
+from http_utils import extract_jwt, request_json, json_response, stream_json_response
 from flask_jwt_extended import jwt_required
+import hashlib
 
 companies_blueprint = Blueprint('companies', __name__)
-company_service: CompanyService = CompanyService(CompanyRepository.CompanyRepository(db), ModelValidator(), DomainClassFactory())
+@lru_cache(maxsize=1)
+def get_company_service() -> CompanyService:
+    """
+    Returns the company service, creating it on first use instead of at import time.
+
+    Returns:
+        CompanyService: The shared CompanyService instance.
+    """
+    return CompanyService(CompanyRepository.CompanyRepository(db), get_model_validator(), get_domain_class_factory())
+
+@companies_blueprint.after_request
+def add_etag(response):
+    """
+    Adds a content ETag to successful GET responses and answers matching `If-None-Match` requests with 304.
+
+    Streamed responses are left untouched, since hashing them would require buffering the whole body.
+
+    Args:
+        response (Response): The response returned by the handler.
+
+    Returns:
+        Response: The response, or a 304 Not Modified response if the client's copy is current.
+    """
+    if request.method != 'GET' or response.status_code != E_RC.RC_OK or response.is_streamed:
+        return response
+
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+    return response.make_conditional(request)
 
 @companies_blueprint.route('/create-company', methods=['POST'])
 @jwt_required() 
+@requires(PermissionMask.NET_ADMIN)
 def create_company():
     """
     Creates a new company.
@@ -23,21 +54,17 @@ def create_company():
     Returns:
         tuple: A JSON response indicating success or failure, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-        
-        data = request.get_json()
-        company_name = data.get('company_name')
+    current_user_email, user_permission, user_company_id = extract_jwt()
+    
+    data = request_json()
+    company_name = data.get('company_name')
 
-        rc: RC = company_service.create_company(company_name, user_permission)
-        return rc.to_json()
-        
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
+    rc: RC = get_company_service().create_company(company_name, user_permission)
+    return rc.to_json()
 
 @companies_blueprint.route('/update-company', methods=['PUT'])
 @jwt_required() 
+@requires(PermissionMask.NET_ADMIN)
 def update_company():
     """
     Updates an existing company.
@@ -48,22 +75,17 @@ def update_company():
     Returns:
         tuple: A JSON response indicating success or failure, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-         
-        data = request.get_json()
-        company_id = data.get('company_id')  
-        company_name = data.get('company_name')
+    current_user_email, user_permission, user_company_id = extract_jwt()
+     
+    data = request_json()
+    company_id, company_name = map(data.get, ('company_id', 'company_name'))
 
-        rc: RC = company_service.update_company(company_id, company_name, user_permission)
-        return rc.to_json()
-    
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
+    rc: RC = get_company_service().update_company(company_id, company_name, user_permission)
+    return rc.to_json()
 
-@companies_blueprint.route('/remove-company/<string:company_id>', methods=['PUT'])
+@companies_blueprint.route('/remove-company/<uuid_str:company_id>', methods=['PUT'])
 @jwt_required() 
+@requires(PermissionMask.NET_ADMIN)
 def remove_company(company_id):
     """
     Removes a company (soft delete).
@@ -76,18 +98,14 @@ def remove_company(company_id):
     Returns:
         tuple: A JSON response indicating success or failure, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-       
-        rc: RC = company_service.delete_company(company_id, user_permission)
-        return rc.to_json()
-    
-    except Exception as e:
-        print_exception(e) 
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
+    current_user_email, user_permission, user_company_id = extract_jwt()
+
+    rc: RC = get_company_service().delete_company(company_id, user_permission)
+    return rc.to_json()
 
 @companies_blueprint.route('/active', methods=['GET'])
 @jwt_required() 
+@requires(PermissionMask.NET_ADMIN)
 def get_active_companies():
     """
     Retrieves active companies.
@@ -97,21 +115,17 @@ def get_active_companies():
     Returns:
         tuple: A JSON response with company data, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-
-        company_data = company_service.get_active_companies(user_permission)
-        if isinstance(company_data, RC):
-            return company_data.to_json()
-        
-        return jsonify(company_data), E_RC.RC_OK
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Internal server error'}), E_RC.RC_ERROR_DATABASE
+    company_data = get_company_service().get_active_companies(user_permission)
+    if isinstance(company_data, RC):
+        return company_data.to_json()
+    
+    return stream_json_response(company_data, E_RC.RC_OK)
 
 @companies_blueprint.route('/', methods=['GET'])
 @jwt_required() 
+@requires(PermissionMask.NET_ADMIN)
 def get_all_companies():
     """
     Retrieves all companies (active and inactive).
@@ -121,21 +135,17 @@ def get_all_companies():
     Returns:
         tuple: A JSON response with company data, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-        
-        company_data: dict|RC = company_service.get_all_companies(user_permission)
-        if isinstance(company_data, RC):
-            return company_data.to_json()
-        
-        return jsonify(company_data), E_RC.RC_OK
-
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Internal server error'}), E_RC.RC_ERROR_DATABASE
+    current_user_email, user_permission, user_company_id = extract_jwt()
+    
+    company_data: dict|RC = get_company_service().get_all_companies(user_permission)
+    if isinstance(company_data, RC):
+        return company_data.to_json()
+    
+    return stream_json_response(company_data, E_RC.RC_OK)
 
-@companies_blueprint.route('<string:company_id>/users', methods=['GET'])
+@companies_blueprint.route('<uuid_str:company_id>/users', methods=['GET'])
 @jwt_required() 
+@requires(PermissionMask.MANAGERS)
 def get_company_users(company_id):
     """
     Retrieves users associated with a specific company.
@@ -148,20 +158,15 @@ def get_company_users(company_id):
     Returns:
         tuple: A JSON response with user data, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-        
-        users: dict|RC= company_service.get_company_users(company_id, user_permission, user_company_id)
-        if isinstance(users, RC):
-            return users.to_json()
-        
-        return jsonify(users), E_RC.RC_OK
-
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': str(e)}), E_RC.RC_ERROR_DATABASE
+    current_user_email, user_permission, user_company_id = extract_jwt()
+    
+    users: dict|RC= get_company_service().get_company_users(company_id, user_permission, user_company_id)
+    if isinstance(users, RC):
+        return users.to_json()
+    
+    return stream_json_response(users, E_RC.RC_OK)
 
-@companies_blueprint.route('/<string:company_id>', methods=['GET'])
+@companies_blueprint.route('/<uuid_str:company_id>', methods=['GET'])
 @jwt_required() 
 def get_company_details(company_id):
     """
@@ -175,21 +180,17 @@ def get_company_details(company_id):
     Returns:
         tuple: A JSON response with company details, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-
-        company: dict|RC = company_service.get_company_details(company_id, user_company_id, user_permission)
-        if isinstance(company, RC):
-            return company.to_json()
-        
-        return jsonify(company), E_RC.RC_OK
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': str(e)}), E_RC.RC_ERROR_DATABASE
+    company: dict|RC = get_company_service().get_company_details(company_id, user_company_id, user_permission)
+    if isinstance(company, RC):
+        return company.to_json()
     
-@companies_blueprint.route('/<string:company_id>/admins', methods=['GET'])
+    return json_response(company, E_RC.RC_OK)
+    
+@companies_blueprint.route('/<uuid_str:company_id>/admins', methods=['GET'])
 @jwt_required()
+@requires(PermissionMask.MANAGERS)
 def get_company_admins(company_id):
     """
     Retrieves administrators associated with a specific company.
@@ -202,21 +203,16 @@ def get_company_admins(company_id):
     Returns:
         tuple: A JSON response with administrator data, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-
-        admin_data: dict|RC = company_service.get_company_admins(company_id, user_company_id, user_permission)
-        if isinstance(admin_data, RC):
-            return admin_data.to_json()
-        
-        return jsonify(admin_data), E_RC.RC_OK
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': str(e)}), E_RC.RC_ERROR_DATABASE
+    admin_data: dict|RC = get_company_service().get_company_admins(company_id, user_company_id, user_permission)
+    if isinstance(admin_data, RC):
+        return admin_data.to_json()
     
+    return json_response(admin_data, E_RC.RC_OK)
     
-@companies_blueprint.route('/<string:company_id>/name', methods=['GET'])
+    
+@companies_blueprint.route('/<uuid_str:company_id>/name', methods=['GET'])
 @jwt_required()
 def get_company_name_by_id(company_id):
     """
@@ -230,15 +226,10 @@ def get_company_name_by_id(company_id):
     Returns:
         tuple: A JSON response with the company name, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-
-        name: dict|RC = company_service.get_company_name_by_id(company_id, user_company_id, user_permission)
-        if isinstance(name, RC):
-            return name.to_json()
-        
-        return jsonify(name), E_RC.RC_OK
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': str(e)}), E_RC.RC_ERROR_DATABASE
\ No newline at end of file
+    name: dict|RC = get_company_service().get_company_name_by_id(company_id, user_company_id, user_permission)
+    if isinstance(name, RC):
+        return name.to_json()
+    
+    return json_response(name, E_RC.RC_OK)
\ No newline at end of file
@@ -1,18 +1,51 @@
-from flask import Blueprint, request, jsonify
+from functools import lru_cache
+from flask import Blueprint, request
 from models import db
-from cmn_utils import *
+from cmn_utils import resolve_date_range
+from http_utils import extract_jwt, json_response, stream_ndjson_response
 from flask_jwt_extended import jwt_required
 from classes.repositories.CompanyRepository import CompanyRepository
+from classes.utilities.Permission import PermissionMask, requires
 from classes.utilities.RC import RC, E_RC
-from classes.validators.ModelValidator import ModelValidator
+from classes.validators.ModelValidator import get_model_validator
 from classes.repositories.UserRepository import UserRepository
 from classes.repositories.TimeStampRepository import TimeStampRepository
-from classes.factories.DomainClassFactory import DomainClassFactory
+from classes.factories.DomainClassFactory import get_domain_class_factory
 from classes.services.ReportService import ReportService
 
 reports_bp = Blueprint('reports', __name__)
 
-report_service = ReportService(UserRepository(db), TimeStampRepository(db), CompanyRepository(db), ModelValidator(), DomainClassFactory())
+@lru_cache(maxsize=1)
+def get_report_service() -> ReportService:
+    """
+    Returns the report service, creating it on first use instead of at import time.
+
+    Returns:
+        ReportService: The shared ReportService instance.
+    """
+    return ReportService(UserRepository(db), TimeStampRepository(db), CompanyRepository(db), get_model_validator(), get_domain_class_factory())
+
+def _resolve_date_range() -> tuple | RC:
+    """
+    Resolves the report date range from the request arguments once, before calling the report service.
+
+    Returns:
+        tuple | RC: The start and end dates as datetime objects, or an RC object indicating invalid input.
+    """
+    try:
+        return resolve_date_range(request.args.get('dateRangeType'), request.args.get('year'), request.args.get('month'),
+                                  request.args.get('start_date'), request.args.get('end_date'))
+    except ValueError as e:
+        return RC(E_RC.RC_INVALID_INPUT, str(e))
+
+def _wants_ndjson() -> bool:
+    """
+    Checks whether the client prefers a newline delimited JSON stream over a JSON array.
+
+    Returns:
+        bool: True if `application/x-ndjson` is the best match of the Accept header.
+    """
+    return request.accept_mimetypes.best == 'application/x-ndjson'
 
 @reports_bp.route('/generate-user', methods=['GET'])
 @jwt_required()
@@ -34,28 +67,24 @@ def generate_user_report():
     Returns:
         tuple: A JSON response with the report data or an error message, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-
-        user_email = request.args.get('user_email')
-        date_range_type = request.args.get('dateRangeType')
-        selected_year = request.args.get('year')
-        selected_month = request.args.get('month')
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-        report = report_service.user_report(user_email, date_range_type, selected_year, selected_month, start_date_str, end_date_str, user_permission, user_company_id, current_user_email)
-        if isinstance(report, RC):
-            return report.to_json()
-        
-        return jsonify(report), E_RC.RC_OK
+    user_email = request.args.get('user_email')
+    date_range = _resolve_date_range()
+    if isinstance(date_range, RC):
+        return date_range.to_json()
+    
+    start_date, end_date = date_range
 
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Failed to generate report'}), E_RC.RC_ERROR_DATABASE
+    report = get_report_service().user_report(user_email, start_date, end_date, user_permission, user_company_id, current_user_email)
+    if isinstance(report, RC):
+        return report.to_json()
+    
+    return json_response(report, E_RC.RC_OK)
 
 @reports_bp.route('/generate-company', methods=['GET'])
 @jwt_required()
+@requires(PermissionMask.MANAGERS)
 def generate_company_summary_report():
     """
     Generates a company summary report.
@@ -73,29 +102,30 @@ def generate_company_summary_report():
 
     Returns:
         tuple: A JSON response with the report data or an error message, along with an HTTP status code.
+               With `Accept: application/x-ndjson` the report is streamed with one entry per line.
+               A stream that fails partway ends with an `{"error": ...}` line.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-        company_id = request.args.get('company_id')
-        date_range_type = request.args.get('dateRangeType')
-        selected_year = request.args.get('year')
-        selected_month = request.args.get('month')
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
+    company_id = request.args.get('company_id')
+    date_range = _resolve_date_range()
+    if isinstance(date_range, RC):
+        return date_range.to_json()
+    
+    start_date, end_date = date_range
 
-        report = report_service.company_summary(company_id, date_range_type, selected_year, selected_month, start_date_str, end_date_str, user_permission, user_company_id)
-        if isinstance(report, RC):
-            return report.to_json()
-        
-        return jsonify(report), E_RC.RC_OK
+    report = get_report_service().company_summary(company_id, start_date, end_date, user_permission, user_company_id)
+    if isinstance(report, RC):
+        return report.to_json()
+    
+    if _wants_ndjson():
+        return stream_ndjson_response(report, E_RC.RC_OK)
 
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Failed to generate report'}), E_RC.RC_ERROR_DATABASE
+    return json_response(list(report), E_RC.RC_OK)
 
 @reports_bp.route('/generate-company-overview', methods=['GET'])
 @jwt_required()
+@requires(PermissionMask.NET_ADMIN)
 def generate_company_overview_report():
     """
     Generates a company overview report.
@@ -112,23 +142,23 @@ def generate_company_overview_report():
 
     Returns:
         tuple: A JSON response with the report data or an error message, along with an HTTP status code.
+               With `Accept: application/x-ndjson` the report is streamed with one entry per line.
+               A stream that fails partway ends with an `{"error": ...}` line.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-        date_range_type = request.args.get('dateRangeType')
-        selected_year = request.args.get('year')
-        selected_month = request.args.get('month')
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
+    date_range = _resolve_date_range()
+    if isinstance(date_range, RC):
+        return date_range.to_json()
+    
+    start_date, end_date = date_range
 
-        report = report_service.company_overview(date_range_type, selected_year, selected_month, start_date_str, end_date_str, user_permission)
-        if isinstance(report, RC):
-            return report.to_json()
+    report = get_report_service().company_overview(start_date, end_date, user_permission)
+    if isinstance(report, RC):
+        return report.to_json()
 
-        return jsonify(report), E_RC.RC_OK
+    if _wants_ndjson():
+        return stream_ndjson_response(report, E_RC.RC_OK)
 
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Failed to generate report'}), E_RC.RC_ERROR_DATABASE
+    return json_response(list(report), E_RC.RC_OK)
 
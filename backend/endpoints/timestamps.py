@@ -1,17 +1,32 @@
-from flask import Blueprint, request, jsonify
+from functools import lru_cache
+from flask import Blueprint, request
 from models import db
 from classes.repositories.UserRepository import UserRepository
 from classes.repositories.TimeStampRepository import TimeStampRepository
 from classes.services.TimeStampService import TimeStampService
-from classes.validators.ModelValidator import ModelValidator
-from classes.factories.DomainClassFactory import DomainClassFactory
+from classes.validators.ModelValidator import get_model_validator
+from classes.factories.DomainClassFactory import get_domain_class_factory
+from classes.utilities.Permission import PermissionMask, requires
 from classes.utilities.RC import RC, E_RC 
-from cmn_utils import print_exception, extract_jwt
+from http_utils import extract_jwt, request_json, json_response, stream_json_response
 from flask_jwt_extended import jwt_required
 
 timestamps_bp = Blueprint('timestamps', __name__)
 
-timestamp_service: TimeStampService = TimeStampService(TimeStampRepository(db), UserRepository(db), ModelValidator(), DomainClassFactory())
+# Payload keys read by the handlers, unpacked with a single map(data.get, ...) call
+_CREATE_FIELDS = ('user_email', 'punch_type', 'reporting_type', 'detail', 'punch_in_timestamp', 'punch_out_timestamp')
+_PUNCH_OUT_FIELDS = ('user_email', 'entered_by', 'reporting_type', 'detail')
+_EDIT_FIELDS = ('punch_in_timestamp', 'punch_out_timestamp', 'punch_type', 'detail', 'reporting_type')
+
+@lru_cache(maxsize=1)
+def get_timestamp_service() -> TimeStampService:
+    """
+    Returns the timestamp service, creating it on first use instead of at import time.
+
+    Returns:
+        TimeStampService: The shared TimeStampService instance.
+    """
+    return TimeStampService(TimeStampRepository(db), UserRepository(db), get_model_validator(), get_domain_class_factory())
 
 @timestamps_bp.route('/', methods=['POST'])
 @jwt_required() 
@@ -25,27 +40,40 @@ def create_timestamp():
     Returns:
         tuple: A JSON response indicating success or failure, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-
-        data = request.get_json()
-        user_email = data.get('user_email')
-        entered_by_user = current_user_email
-        punch_type = data.get('punch_type')
-        reporting_type = data.get('reporting_type')
-        detail = data.get('detail')
-        punch_in = data.get("punch_in_timestamp")
-        punch_out = data.get("punch_out_timestamp")
-        
-        rc: RC = timestamp_service.create_timestamp(user_email, entered_by_user, punch_type, punch_in, punch_out, reporting_type, detail, user_permission, user_company_id)
-        return rc.to_json()
+    current_user_email, user_permission, user_company_id = extract_jwt()
+
+    data = request_json()
+    user_email, punch_type, reporting_type, detail, punch_in, punch_out = map(data.get, _CREATE_FIELDS)
+    entered_by_user = current_user_email
+    
+    rc: RC = get_timestamp_service().create_timestamp(user_email, entered_by_user, punch_type, punch_in, punch_out, reporting_type, detail, user_permission, user_company_id)
+    return rc.to_json()
+
+@timestamps_bp.route('/bulk', methods=['POST'])
+@jwt_required() 
+def create_timestamps_bulk():
+    """
+    Creates many timestamp records in one request.
 
-    except Exception as error:
-        print_exception(error)
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
+    Expects a JSON array of objects with the same keys as the single create request.
+    Requires a JWT token for authentication.
+
+    Returns:
+        tuple: A JSON response with the number of inserted timestamps or an error message, with an HTTP status code.
+    """
+    current_user_email, user_permission, user_company_id = extract_jwt()
+
+    data = request_json()
+
+    inserted: int|RC = get_timestamp_service().create_timestamps_bulk(data, current_user_email, user_permission, user_company_id)
+    if isinstance(inserted, RC):
+        return inserted.to_json()
+    
+    return json_response({'inserted': inserted}, E_RC.RC_OK)
 
 @timestamps_bp.route('/', methods=['GET'])
 @jwt_required() 
+@requires(PermissionMask.NET_ADMIN)
 def get_timestamps():
     """
     Retrieves all timestamp records.
@@ -55,18 +83,13 @@ def get_timestamps():
     Returns:
         tuple: A JSON response with timestamp data or an error message, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-         
-        timestamps = timestamp_service.get_all_timestamps(user_permission)
-        if isinstance(timestamps, RC):
-            return timestamps.to_json()
-            
-        return jsonify(timestamps), E_RC.RC_OK
-
-    except Exception as error:
-        print_exception(error)
-        return jsonify({'error': 'Internal server error'}), E_RC.RC_ERROR_DATABASE
+    current_user_email, user_permission, user_company_id = extract_jwt()
+     
+    timestamps = get_timestamp_service().get_all_timestamps(user_permission)
+    if isinstance(timestamps, RC):
+        return timestamps.to_json()
+        
+    return stream_json_response(timestamps, E_RC.RC_OK)
 
 @timestamps_bp.route('/', methods=['PUT'])
 @jwt_required() 
@@ -80,22 +103,13 @@ def punch_out():
     Returns:
         tuple: A JSON response indicating success or failure, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-        data = request.get_json()
-        user_email = data.get('user_email')
-        entered_by = data.get('entered_by')
-        reporting_type = data.get('reporting_type')
-        detail = data.get('detail')
+    data = request_json()
+    user_email, entered_by, reporting_type, detail = map(data.get, _PUNCH_OUT_FIELDS)
 
-        rc : RC = timestamp_service.punch_out(user_email, entered_by, reporting_type, detail, user_permission, user_company_id)
-        return rc.to_json()
-    
-    except Exception as error:
-        print_exception(error)
-        db.session.rollback()
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
+    rc : RC = get_timestamp_service().punch_out(user_email, entered_by, reporting_type, detail, user_permission, user_company_id)
+    return rc.to_json()
     
 @timestamps_bp.route('/<uuid:timestamp_uuid>', methods=['PUT'])
 @jwt_required()
@@ -112,24 +126,14 @@ def edit(timestamp_uuid):
     Returns:
         tuple: A JSON response indicating success or failure, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-
-        data = request.get_json()
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-        punch_in_timestamp = data.get('punch_in_timestamp')
-        punch_out_timestamp = data.get('punch_out_timestamp')
-        punch_type = data.get('punch_type')
-        detail = data.get('detail')
-        reporting_type = data.get('reporting_type')
-        
-        rc: RC = timestamp_service.edit_timestamp(timestamp_uuid, punch_in_timestamp, punch_out_timestamp, punch_type, detail, reporting_type, current_user_email, user_permission, user_company_id)
-        
-        return rc.to_json()
+    data = request_json()
+    punch_in_timestamp, punch_out_timestamp, punch_type, detail, reporting_type = map(data.get, _EDIT_FIELDS)
+    
+    rc: RC = get_timestamp_service().edit_timestamp(timestamp_uuid, punch_in_timestamp, punch_out_timestamp, punch_type, detail, reporting_type, current_user_email, user_permission, user_company_id)
     
-    except Exception as error:
-        print_exception(error)
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
+    return rc.to_json()
 
 @timestamps_bp.route('/punch_in_status', methods=['POST'])
 @jwt_required() 
@@ -143,24 +147,42 @@ def check_punch_in_status():
     Returns:
         tuple: A JSON response indicating whether the user has an active punch-in, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-        data = request.get_json()
-        user_email = data.get('user_email')
+    data = request_json()
+    user_email = data.get('user_email')
 
-        answer: bool|RC= timestamp_service.check_punch_in_status(user_email, current_user_email, user_permission, user_company_id)
-        if isinstance(answer, RC):
-            return answer.to_json()
-        
-        elif answer:
-            return jsonify({'has_punch_in': True}), E_RC.RC_OK
-        else:
-            return jsonify({'has_punch_in': False}), E_RC.RC_OK
+    answer: bool|RC= get_timestamp_service().check_punch_in_status(user_email, current_user_email, user_permission, user_company_id)
+    if isinstance(answer, RC):
+        return answer.to_json()
+    
+    elif answer:
+        return json_response({'has_punch_in': True}, E_RC.RC_OK)
+    else:
+        return json_response({'has_punch_in': False}, E_RC.RC_OK)
 
-    except Exception as error:
-        print_exception(error)
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
+@timestamps_bp.route('/punch_in_status/bulk', methods=['POST'])
+@jwt_required() 
+def check_punch_in_status_bulk():
+    """
+    Checks which of several users have an active punch-in timestamp.
+
+    Expects a JSON payload with `emails`, a list of user emails.
+    Requires a JWT token for authentication.
+
+    Returns:
+        tuple: A JSON response mapping each email to whether the user has an active punch-in, with an HTTP status code.
+    """
+    current_user_email, user_permission, user_company_id = extract_jwt()
+
+    data = request_json()
+    user_emails = data.get('emails')
+
+    statuses: dict|RC = get_timestamp_service().check_punch_in_status_bulk(user_emails, current_user_email, user_permission, user_company_id)
+    if isinstance(statuses, RC):
+        return statuses.to_json()
+    
+    return json_response(statuses, E_RC.RC_OK)
 
 @timestamps_bp.route('/<uuid:uuid>', methods=['DELETE'])
 @jwt_required() 
@@ -176,16 +198,10 @@ def delete_timestamp(uuid):
     Returns:
         tuple: A JSON response indicating success or failure, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-        rc: RC = timestamp_service.delete_timestamp(uuid, current_user_email, user_permission, user_company_id)
-        return rc.to_json()
-        
-    except Exception as error:
-        print_exception(error)
-        db.session.rollback()
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
+    rc: RC = get_timestamp_service().delete_timestamp(uuid, current_user_email, user_permission, user_company_id)
+    return rc.to_json()
 
 
 @timestamps_bp.route('/getRange/<string:user_email>', methods=['GET'])
@@ -204,18 +220,13 @@ def get_timestamps_range(user_email):
     Returns:
         tuple: A JSON response with timestamp data or an error message, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-        start_date_str = request.args.get('start_date')
-        end_date_str = request.args.get('end_date')
-        
-        timestamps = timestamp_service.get_timestamps_range(user_email, start_date_str, end_date_str, current_user_email, user_permission, user_company_id)
-        if isinstance(timestamps, RC):
-            return timestamps.to_json()
-        
-        return jsonify(timestamps), E_RC.RC_OK
-
-    except Exception as error:
-        print_exception(error)
-        return jsonify({'error': 'Internal server error'}), E_RC.RC_ERROR_DATABASE
\ No newline at end of file
+    start_date_str = request.args.get('start_date')
+    end_date_str = request.args.get('end_date')
+    
+    timestamps = get_timestamp_service().get_timestamps_range(user_email, start_date_str, end_date_str, current_user_email, user_permission, user_company_id)
+    if isinstance(timestamps, RC):
+        return timestamps.to_json()
+    
+    return stream_json_response(timestamps, E_RC.RC_OK)
\ No newline at end of file
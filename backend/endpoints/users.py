@@ -1,21 +1,42 @@
-from flask import Blueprint, request, jsonify
+from functools import lru_cache
+from flask import Blueprint
 from models import db  
 from classes.repositories.UserRepository import UserRepository
 from classes.repositories.CompanyRepository import CompanyRepository
-from classes.validators.ModelValidator import ModelValidator
-from classes.factories.DomainClassFactory import DomainClassFactory
+from classes.validators.ModelValidator import get_model_validator
+from classes.factories.DomainClassFactory import get_domain_class_factory
 from classes.domainclasses.User import User
 from classes.services.UserService import UserService
+from classes.utilities.Permission import PermissionMask, requires
 from classes.utilities.RC import RC, E_RC
-from cmn_utils import *
+from classes.utilities.PasswordHasher import get_password_hasher
+from classes.utilities.TokenBlocklist import get_token_blocklist
+from http_utils import extract_jwt, request_json, json_response, raw_json_response, stream_json_response
+from config import PASSWORD_HASHER
 from flask_jwt_extended import jwt_required
 
 
 users_blueprint = Blueprint('users', __name__)
-user_service = UserService(UserRepository(db), CompanyRepository(db), ModelValidator(), DomainClassFactory())
+
+# Payload keys read by the handlers, unpacked with a single map(data.get, ...) call
+_CREATE_FIELDS = ('first_name', 'last_name', 'email', 'password', 'company_name', 'role', 'permission', 'salary', 'work_capacity',
+                  'employment_start', 'employment_end', 'weekend_choice', 'mobile_phone')
+_UPDATE_FIELDS = ('email', 'first_name', 'last_name', 'mobile_phone', 'role', 'permission', 'salary', 'work_capacity', 'password',
+                  'employment_start', 'employment_end', 'weekend_choice')
+
+@lru_cache(maxsize=1)
+def get_user_service() -> UserService:
+    """
+    Returns the user service, creating it on first use instead of at import time.
+
+    Returns:
+        UserService: The shared UserService instance.
+    """
+    return UserService(UserRepository(db), CompanyRepository(db), get_model_validator(), get_domain_class_factory(), get_password_hasher(PASSWORD_HASHER))
 
 @users_blueprint.route('/create-user', methods=['POST'])
 @jwt_required() 
+@requires(PermissionMask.NET_ADMIN)
 def create_user():
     """
     Creates a new user.
@@ -26,94 +47,69 @@ def create_user():
     Returns:
         tuple: A JSON response indicating success or failure, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-        
-        
-        data = request.get_json()
-        first_name = data.get('first_name')
-        last_name = data.get('last_name')
-        email = data.get('email')
-        password = data.get('password')
-        company_name = data.get('company_name')
-        role = data.get('role')
-        permission = data.get('permission')
-        salary = data.get('salary')
-        work_capacity = data.get('work_capacity')
-        employment_start_str = data.get('employment_start')
-        employment_end_str = data.get('employment_end')
-        weekend_choice = data.get('weekend_choice')
-        mobile_phone = data.get('mobile_phone')
-        
-        rc: RC = user_service.create_user(
-            email=email,
-            first_name=first_name,
-            last_name=last_name,
-            company_name=company_name, 
-            role=role,
-            permission=permission,
-            password=password,
-            salary=salary,
-            work_capacity=work_capacity,
-            employment_start_str=employment_start_str,
-            employment_end_str=employment_end_str,
-            weekend_choice=weekend_choice,
-            mobile_phone=mobile_phone,
-            user_permission=user_permission,
-        )
-
-        return rc.to_json()
+    current_user_email, user_permission, user_company_id = extract_jwt()
     
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
+    
+    data = request_json()
+    first_name, last_name, email, password, company_name, role, permission, salary, work_capacity, \
+        employment_start_str, employment_end_str, weekend_choice, mobile_phone = map(data.get, _CREATE_FIELDS)
+    
+    rc: RC = get_user_service().create_user(
+        email=email,
+        first_name=first_name,
+        last_name=last_name,
+        company_name=company_name, 
+        role=role,
+        permission=permission,
+        password=password,
+        salary=salary,
+        work_capacity=work_capacity,
+        employment_start_str=employment_start_str,
+        employment_end_str=employment_end_str,
+        weekend_choice=weekend_choice,
+        mobile_phone=mobile_phone,
+        user_permission=user_permission,
+    )
+
+    return rc.to_json()
 
 @users_blueprint.route('/update-user', methods=['PUT'])
 @jwt_required() 
+@requires(PermissionMask.NET_ADMIN)
 def update_user():
     """
     Updates an existing user.
 
+    If the password is reset, every token issued to the user so far is revoked.
     Expects a JSON payload with updated user details.
     Requires a JWT token for authentication.
 
     Returns:
         tuple: A JSON response indicating success or failure, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-        
-        data: dict = request.get_json()
-        user_email = data.get('email')  
-        first_name = data.get('first_name')
-        last_name = data.get('last_name')
-        mobile_phone = data.get('mobile_phone')
-        role = data.get('role')
-        permission = data.get('permission')
-        salary = data.get('salary')
-        work_capacity = data.get('work_capacity')
-        password = data.get('password')
-        employment_start_str = data.get('employment_start')
-        employment_end_str = data.get('employment_end')
-        weekend_choice = data.get('weekend_choice')
-
-        rc: RC = user_service.update_user(user_email, user_permission, first_name=first_name, last_name=last_name, mobile_phone=mobile_phone, \
-            role=role, permission=permission, salary=salary, work_capacity=work_capacity,\
-                employment_start_str=employment_start_str, employment_end_str=employment_end_str, weekend_choice=weekend_choice,\
-                    password=password)
-        
-        return rc.to_json()
-
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
+    current_user_email, user_permission, user_company_id = extract_jwt()
+    
+    data: dict = request_json()
+    user_email, first_name, last_name, mobile_phone, role, permission, salary, work_capacity, password, \
+        employment_start_str, employment_end_str, weekend_choice = map(data.get, _UPDATE_FIELDS)
+
+    rc: RC = get_user_service().update_user(user_email, user_permission, first_name=first_name, last_name=last_name, mobile_phone=mobile_phone, \
+        role=role, permission=permission, salary=salary, work_capacity=work_capacity,\
+            employment_start_str=employment_start_str, employment_end_str=employment_end_str, weekend_choice=weekend_choice,\
+                password=password)
+    if password and rc.code == E_RC.RC_OK:
+        get_token_blocklist().revoke_user_tokens(user_email)
+    
+    return rc.to_json()
 
 @users_blueprint.route('/remove-user/<string:user_email>', methods=['PUT']) 
 @jwt_required() 
+@requires(PermissionMask.NET_ADMIN)
 def remove_user(user_email):
     """
     Removes a user (soft delete).
 
+    On success, every token issued to the user so far is revoked.
     Expects an optional JSON payload with `employment_end`.
     Requires a JWT token for authentication.
 
@@ -123,23 +119,21 @@ def remove_user(user_email):
     Returns:
         tuple: A JSON response indicating success or failure, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-         
-    
-        data: dict = request.get_json()
-        employment_end_str = data.get('employment_end')  
+    current_user_email, user_permission, user_company_id = extract_jwt()
+     
 
-        rc: RC = user_service.delete_user(user_permission, user_email, employment_end_str)
+    data: dict = request_json()
+    employment_end_str = data.get('employment_end')  
 
-        return rc.to_json()
-        
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Server error'}), E_RC.RC_ERROR_DATABASE
+    rc: RC = get_user_service().delete_user(user_permission, user_email, employment_end_str)
+    if rc.code == E_RC.RC_OK:
+        get_token_blocklist().revoke_user_tokens(user_email)
+
+    return rc.to_json()
 
 @users_blueprint.route('/active', methods=['GET'])
 @jwt_required() 
+@requires(PermissionMask.MANAGERS)
 def get_active_users():
     """
     Retrieves active users.
@@ -149,21 +143,17 @@ def get_active_users():
     Returns:
         tuple: A JSON response with user data or an error message, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-
-        user_data: dict = user_service.get_active_users(user_permission, user_company_id)
-        if isinstance(user_data, RC):
-            return user_data.to_json()
-            
-        return jsonify(user_data), E_RC.RC_OK
-
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Internal server error'}), E_RC.RC_ERROR_DATABASE
+    current_user_email, user_permission, user_company_id = extract_jwt()
+
+    user_data: str = get_user_service().get_active_users(user_permission, user_company_id)
+    if isinstance(user_data, RC):
+        return user_data.to_json()
+        
+    return raw_json_response(user_data, E_RC.RC_OK)
     
 @users_blueprint.route('/not-active', methods=['GET'])
 @jwt_required() 
+@requires(PermissionMask.MANAGERS)
 def get_inactive_users():
     """
     Retrieves inactive users.
@@ -173,21 +163,17 @@ def get_inactive_users():
     Returns:
         tuple: A JSON response with user data or an error message, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-        user_data: dict = user_service.get_inactive_users(user_permission, user_company_id)
-        if isinstance(user_data, RC):
-            return user_data.to_json()
-            
-        return jsonify(user_data), E_RC.RC_OK
-
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Internal server error'}), E_RC.RC_ERROR_DATABASE
+    user_data: dict = get_user_service().get_inactive_users(user_permission, user_company_id)
+    if isinstance(user_data, RC):
+        return user_data.to_json()
+        
+    return json_response(user_data, E_RC.RC_OK)
 
 @users_blueprint.route('/', methods=['GET'])
 @jwt_required() 
+@requires(PermissionMask.MANAGERS)
 def get_all_users():
     """
     Retrieves all users (active and inactive).
@@ -197,18 +183,13 @@ def get_all_users():
     Returns:
         tuple: A JSON response with user data or an error message, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
+    current_user_email, user_permission, user_company_id = extract_jwt()
 
-        user_data: dict = user_service.get_all_users(user_permission, user_company_id)
-        if isinstance(user_data, RC):
-            return user_data.to_json()
-            
-        return jsonify(user_data), E_RC.RC_OK
-
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Internal server error'}), E_RC.RC_ERROR_DATABASE
+    user_data = get_user_service().get_all_users(user_permission, user_company_id)
+    if isinstance(user_data, RC):
+        return user_data.to_json()
+        
+    return stream_json_response(user_data, E_RC.RC_OK)
 
 @users_blueprint.route('/user-by-email/<string:email>', methods=['GET'])
 @jwt_required() 
@@ -223,18 +204,13 @@ def user_by_email(email):
     Returns:
         tuple: A JSON response with user data or an error message, along with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-        
-        requested_user: User = user_service.get_user_by_email(user_permission, current_user_email, user_company_id, email)
-        if isinstance (requested_user,RC):
-            return requested_user.to_json()
-        
-        return jsonify(requested_user), E_RC.RC_OK
-
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': str(e)}), E_RC.RC_ERROR_DATABASE
+    current_user_email, user_permission, user_company_id = extract_jwt()
+    
+    requested_user: User = get_user_service().get_user_by_email(user_permission, current_user_email, user_company_id, email)
+    if isinstance (requested_user,RC):
+        return requested_user.to_json()
+    
+    return json_response(requested_user, E_RC.RC_OK)
     
 @users_blueprint.route('/change-password', methods=['POST'])
 @jwt_required()
@@ -242,27 +218,26 @@ def change_password():
     """
     Changes the password of the current user.
 
+    On success, every token issued to the user so far is revoked.
     Expects a JSON payload with `new_password`.
     Requires a JWT token for authentication.
 
     Returns:
         tuple: A JSON response indicating success or failure, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-        data = request.get_json()
-        new_password = data.get('new_password')
-
-        rc: RC = user_service.change_password(user_permission, current_user_email, user_company_id, current_user_email, new_password)
-        
-        return rc.to_json()
+    current_user_email, user_permission, user_company_id = extract_jwt()
+    data = request_json()
+    new_password = data.get('new_password')
 
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Failed to change password'}), E_RC.RC_ERROR_DATABASE
+    rc: RC = get_user_service().change_password(user_permission, current_user_email, user_company_id, current_user_email, new_password)
+    if rc.code == E_RC.RC_OK:
+        get_token_blocklist().revoke_user_tokens(current_user_email)
+    
+    return rc.to_json()
     
 @users_blueprint.route('/reactivate-user', methods=['PUT'])
 @jwt_required()
+@requires(PermissionMask.NET_ADMIN)
 def reactivate_user():
     """
     Reactivates a user.
@@ -273,16 +248,11 @@ def reactivate_user():
     Returns:
         tuple: A JSON response indicating success or failure, with an HTTP status code.
     """
-    try:
-        current_user_email, user_permission, user_company_id = extract_jwt()
-        data = request.get_json()
-        user_email = data.get('user_email')
-
-        rc: RC = user_service.reactivate_user(user_permission, user_email)
-        
-        return rc.to_json()
+    current_user_email, user_permission, user_company_id = extract_jwt()
+    data = request_json()
+    user_email = data.get('user_email')
 
-    except Exception as e:
-        print_exception(e)
-        return jsonify({'error': 'Failed to change password'}), E_RC.RC_ERROR_DATABASE
+    rc: RC = get_user_service().reactivate_user(user_permission, user_email)
+    
+    return rc.to_json()
     
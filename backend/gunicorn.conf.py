@@ -0,0 +1,15 @@
+import multiprocessing
+import os
+
+# Request handlers mostly wait on the database, so each worker serves requests from a thread pool.
+# Each worker owns a SQLAlchemy pool sized from GUNICORN_THREADS (see config.py), so one host opens at most
+# workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) Postgres connections: 4 * (8 + 2) = 40 with the defaults,
+# well below Postgres's default max_connections of 100. Raise workers or threads only with that total in mind.
+#
+# The database is not created here; run "python db_init.py" once before starting gunicorn.
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:3000')
+worker_class = 'gthread'
+workers = int(os.getenv('GUNICORN_WORKERS', min(multiprocessing.cpu_count() * 2 + 1, 4)))
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+keepalive = 5
+timeout = 60
@@ -0,0 +1,206 @@
+import itertools
+import zlib
+from flask import Response, stream_with_context, g, request
+from werkzeug.exceptions import BadRequest
+from flask_jwt_extended import get_jwt
+import orjson
+from classes.utilities.ORJSONProvider import dumps_bytes
+from cmn_utils import print_exception
+
+_NDJSON_ERROR_LINE = dumps_bytes({'error': 'Server error'}) + b'\n'
+
+def extract_jwt() -> tuple:
+    """
+    Extracts user information from the JWT token.
+
+    The result is cached on `flask.g`, so repeated calls within one request read the claims only once.
+
+    Returns:
+        tuple: A tuple containing the user's email, permission level, and company ID.
+    """
+    jwt_claims = g.get('jwt_claims')
+    if jwt_claims is None:
+        claims = get_jwt()
+        current_user_email = claims.get('sub')  # default JWT_IDENTITY_CLAIM
+        user_permission = claims.get('permission') 
+        user_company_id = claims.get('company_id') 
+        jwt_claims = g.jwt_claims = (current_user_email, user_permission, user_company_id)
+
+    return jwt_claims
+
+def request_json():
+    """
+    Parses the JSON body of the current request with orjson.
+
+    The raw body is not cached on the request, so it is released once parsed. An empty body is parsed as an empty object.
+
+    Returns:
+        The parsed JSON value.
+
+    Raises:
+        BadRequest: If the body is not valid JSON.
+    """
+    try:
+        return orjson.loads(request.get_data(cache=False) or b'{}')
+    except orjson.JSONDecodeError:
+        raise BadRequest('Failed to decode JSON object')
+
+def json_response(obj, status: int = 200) -> Response:
+    """
+    Creates a JSON response serialized directly to bytes with the app's orjson options.
+
+    Every endpoint builds its JSON responses with this helper instead of `jsonify`.
+
+    Args:
+        obj: A JSON serializable object.
+        status (int): The HTTP status code of the response.
+
+    Returns:
+        Response: The Flask response.
+    """
+    return Response(dumps_bytes(obj), status=status, mimetype='application/json')
+
+def raw_json_response(body: str | bytes, status: int = 200) -> Response:
+    """
+    Creates a JSON response from an already encoded JSON body.
+
+    Args:
+        body (str | bytes): The JSON document.
+        status (int): The HTTP status code of the response.
+
+    Returns:
+        Response: The Flask response.
+    """
+    return Response(body, status=status, mimetype='application/json')
+
+def stream_json_array(items):
+    """
+    Serializes an iterable to a JSON array one item at a time.
+
+    Args:
+        items: An iterable of JSON serializable objects.
+
+    Yields:
+        bytes: Chunks of the JSON array.
+    """
+    yield b'['
+    separator = b''
+    for item in items:
+        yield separator + dumps_bytes(item)
+        separator = b','
+    yield b']'
+
+def stream_json_response(items, status: int = 200) -> Response:
+    """
+    Creates a streamed JSON array response, so the first bytes are sent before all items are serialized.
+
+    Args:
+        items: An iterable of JSON serializable objects.
+        status (int): The HTTP status code of the response.
+
+    Returns:
+        Response: The streamed Flask response.
+    """
+    return _streamed_response(stream_json_array(_prefetched(items)), status, 'application/json')
+
+def stream_ndjson_response(items, status: int = 200) -> Response:
+    """
+    Creates a streamed newline delimited JSON response with one item per line.
+
+    A truncated NDJSON body is still valid, so if producing an item fails after streaming started,
+    a final `{"error": ...}` line is sent to tell the client the stream is incomplete.
+
+    Args:
+        items: An iterable of JSON serializable objects.
+        status (int): The HTTP status code of the response.
+
+    Returns:
+        Response: The streamed Flask response.
+    """
+    return _streamed_response((dumps_bytes(item) + b'\n' for item in _prefetched(items)), status, 'application/x-ndjson', _NDJSON_ERROR_LINE)
+
+def _prefetched(items):
+    """
+    Takes the first item of an iterable before the response is returned.
+
+    Lazy query results run their SQL on the first fetch, so connection and query errors are raised here,
+    while the error handler can still send a 500, instead of after the 200 status has been sent.
+
+    Args:
+        items: An iterable of JSON serializable objects.
+
+    Returns:
+        Iterator: The same items, including the prefetched first one.
+    """
+    items = iter(items)
+    for first in items:
+        return itertools.chain((first,), items)
+    return iter(())
+
+def _guarded_chunks(chunks, error_chunk: bytes = b''):
+    """
+    Passes through the chunks of a streamed response, stopping cleanly if producing one fails.
+
+    Once streaming started the status cannot change anymore, so the error is logged, the session is
+    rolled back (the error handler does not run for streamed bodies) and the body ends with `error_chunk`.
+    A JSON array cut off this way is not valid JSON, so no error chunk is needed for it, while an NDJSON
+    body needs one to be told apart from a complete stream.
+
+    Args:
+        chunks: An iterable of bytes.
+        error_chunk (bytes): The chunk sent after an error. Defaults to none.
+
+    Yields:
+        bytes: The chunks produced before any error, followed by `error_chunk` on error.
+    """
+    try:
+        yield from chunks
+    except Exception as e:
+        print_exception(e)
+        from models import db
+        db.session.rollback()
+        if error_chunk:
+            yield error_chunk
+
+def _gzip_chunks(chunks):
+    """
+    Compresses a stream of byte chunks incrementally with gzip.
+
+    Each chunk is sync-flushed, so the client can decode it as soon as it arrives.
+
+    Args:
+        chunks: An iterable of bytes.
+
+    Yields:
+        bytes: Chunks of the gzip stream.
+    """
+    compressor = zlib.compressobj(4, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def _streamed_response(chunks, status: int, mimetype: str, error_chunk: bytes = b'') -> Response:
+    """
+    Creates a streamed response, gzip compressing it on the fly when the client accepts gzip.
+
+    Flask-Compress is configured to skip streamed responses, since it would buffer the whole body first.
+
+    Args:
+        chunks: An iterable of bytes.
+        status (int): The HTTP status code of the response.
+        mimetype (str): The mimetype of the response.
+        error_chunk (bytes): The chunk that ends the body if streaming fails. Defaults to none.
+
+    Returns:
+        Response: The streamed Flask response.
+    """
+    chunks = _guarded_chunks(chunks, error_chunk)
+    if 'gzip' not in request.accept_encodings:
+        return Response(stream_with_context(chunks), status=status, mimetype=mimetype)
+
+    response = Response(stream_with_context(_gzip_chunks(chunks)), status=status, mimetype=mimetype)
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
@@ -1,21 +1,27 @@
-from flask import Flask, jsonify
+from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS, cross_origin
+from flask_compress import Compress
 from endpoints.auth import auth_blueprint
 from endpoints.companies import companies_blueprint
 from endpoints.users import users_blueprint
 from endpoints.timestamps import timestamps_bp
 from endpoints.reports import reports_bp
 from classes.utilities.RC import E_RC
+from classes.utilities.ORJSONProvider import ORJSONProvider
+from classes.utilities.UUIDStrConverter import UUIDStrConverter
+from classes.utilities.TokenBlocklist import get_token_blocklist
 from config import Config
 from db_init import create_db
 from dotenv import load_dotenv
 from models import db
 from flask_jwt_extended import JWTManager
+from werkzeug.exceptions import HTTPException
 import sys
 import os
 from datetime import timedelta
 from cmn_utils import *
+from http_utils import json_response
 
 backend_parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 
@@ -28,6 +34,10 @@ load_dotenv()
 
 app = Flask(__name__)
 app.config.from_object(Config)
+app.json = ORJSONProvider(app)
+app.url_map.converters['uuid_str'] = UUIDStrConverter
+# Match '/api/users' and '/api/users/' alike instead of redirecting, since a redirected preflight fails CORS
+app.url_map.strict_slashes = False
 
 # Apply CORS globally before registering blueprints
 CORS(app, resources={r"/*": {"origins": f"http://{Config.WEB_URL}:{Config.WEB_PORT}", "supports_credentials": True}})
@@ -35,10 +45,30 @@ app.config['SQLALCHEMY_DATABASE_URI'] = f'postgresql://{Config.DB_USER}:{Config.
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False  
 app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(minutes=10) 
 app.config['JWT_REFRESH_TOKEN_EXPIRES'] = timedelta(days=30)
+app.config['JWT_DECODE_ALGORITHMS'] = ['HS256']
+
+# HS256 secret as bytes, encoded once instead of on every token verification
+_JWT_DECODE_KEY = Config.JWT_SECRET_KEY.encode('utf-8')
 
 db.init_app(app)
 jwt = JWTManager(app)
 
+@jwt.decode_key_loader
+def jwt_decode_key(jwt_header, jwt_payload: dict) -> bytes:
+    """
+    Returns the key used to verify tokens, bypassing the per-request config lookup.
+    """
+    return _JWT_DECODE_KEY
+
+@jwt.token_in_blocklist_loader
+def check_if_token_revoked(jwt_header, jwt_payload: dict) -> bool:
+    """
+    Rejects tokens issued before their user's last revocation (e.g. a password change).
+    """
+    return get_token_blocklist().is_revoked(jwt_payload)
+
+Compress(app)
+
 # Register blueprints
 app.register_blueprint(auth_blueprint, url_prefix=BASE_API+'/auth')
 app.register_blueprint(companies_blueprint, url_prefix=BASE_API + '/companies')
@@ -56,9 +86,22 @@ def not_found(error):
     Returns a JSON response with an error message and a 404 status code, 
     including CORS headers to allow cross-origin requests.
     """
-    response = jsonify({'error': 'Not found'})
-    response.status_code = E_RC.RC_NOT_FOUND
-    return response
+    return json_response({'error': 'Not found'}, E_RC.RC_NOT_FOUND)
+
+@app.errorhandler(Exception)
+def server_error(error):
+    """
+    Handles exceptions raised by request handlers.
+
+    Logs the exception, rolls back the database session, and returns a generic JSON error
+    with a 500 status code. HTTP exceptions are passed through unchanged.
+    """
+    if isinstance(error, HTTPException):
+        return error
+
+    print_exception(error)
+    db.session.rollback()
+    return json_response({'error': 'Server error'}, E_RC.RC_ERROR_DATABASE)
 
 if __name__ == '__main__':
     print("Registered Routes:")
@@ -1,9 +1,9 @@
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import func, DateTime
+from sqlalchemy import func, cast, DateTime, Integer
 from sqlalchemy.sql import expression
-from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import column_property
 from classes.domainclasses.User import User
 from classes.domainclasses.Company import Company
 from classes.domainclasses.TimeStamp import TimeStamp
@@ -29,21 +29,21 @@ class CompanyModel(db.Model, ModelInterface):
     Also defines a relationship with the `UserModel` for users belonging to the company.
 
     Attributes:
-        company_id (UUID): Primary key, automatically generated UUID.
+        company_id (str): Primary key, automatically generated UUID, loaded as a string.
         company_name (str): Name of the company.
         is_active (bool): Indicates if the company is active.
         users (relationship): Relationship with `UserModel` for users in the company.
     """
     __tablename__ = 'companies'
-    company_id = db.Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v4())
+    company_id = db.Column(UUID(as_uuid=False), primary_key=True, server_default=func.uuid_generate_v4())
     company_name = db.Column(db.String(255), nullable=False)
     is_active = db.Column(db.Boolean, default=True)
-    users = db.relationship('UserModel', backref='company')
+    users = db.relationship('UserModel', back_populates='company', lazy='raise')
 
     def to_class(self):
         """Converts a `CompanyModel` object to a `Company` domain object."""
         return Company(
-            company_id=str(self.company_id),
+            company_id=self.company_id,
             company_name=self.company_name,
             is_active=self.is_active
         )
@@ -60,7 +60,7 @@ class UserModel(db.Model, ModelInterface):
         first_name (str): First name of the user.
         last_name (str): Last name of the user.
         mobile_phone (str): Mobile phone number of the user.
-        company_id (UUID): Foreign key referencing `CompanyModel`.
+        company_id (str): Foreign key referencing `CompanyModel`, loaded as a string.
         role (str): Role of the user in the company.
         permission (int): Permission level of the user.
         pass_hash (str): Hashed password of the user.
@@ -70,22 +70,36 @@ class UserModel(db.Model, ModelInterface):
         employment_start (datetime): Employment start date.
         employment_end (datetime): Employment end date (if applicable).
         weekend_choice (str): User's preferred weekend days.
+        company (relationship): Relationship with `CompanyModel` for the user's company.
+        timestamps (relationship): Relationship with `TimeStampModel` for the user's timestamps.
+        entered_timestamps (relationship): Relationship with `TimeStampModel` for the timestamps the user entered.
+
+    Indexes:
+        ix_users_active: Partial index on company_id of active users, for the active user lists.
+        ix_users_inactive: Partial index on company_id of inactive users, for the inactive user lists.
     """
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index('ix_users_active', 'company_id', postgresql_where=db.text('is_active')),
+        db.Index('ix_users_inactive', 'company_id', postgresql_where=db.text('NOT is_active')),
+    )
     email = db.Column(db.String(255), primary_key=True)
     first_name = db.Column(db.String(255))
     last_name = db.Column(db.String(255))
     mobile_phone = db.Column(db.String(11))
-    company_id = db.Column(UUID(as_uuid=True), db.ForeignKey('companies.company_id'))
+    company_id = db.Column(UUID(as_uuid=False), db.ForeignKey('companies.company_id'))
     role = db.Column(db.String(255))
     permission = db.Column(db.Integer)
     pass_hash = db.Column(db.String(255))
     is_active = db.Column(db.Boolean)
-    salary = db.Column(db.Numeric)
-    work_capacity = db.Column(db.Numeric)
+    salary = db.Column(db.Numeric(asdecimal=False))
+    work_capacity = db.Column(db.Numeric(asdecimal=False))
     employment_start = db.Column(db.DateTime(timezone=True))
     employment_end = db.Column(db.DateTime(timezone=True))
     weekend_choice = db.Column(db.String(64))
+    company = db.relationship('CompanyModel', back_populates='users')
+    timestamps = db.relationship('TimeStampModel', foreign_keys='TimeStampModel.user_email', back_populates='user', lazy='raise')
+    entered_timestamps = db.relationship('TimeStampModel', foreign_keys='TimeStampModel.entered_by', back_populates='entered_by_user', lazy='raise')
 
     def to_class(self):
         """Converts a `UserModel` object to a `User` domain object."""
@@ -94,13 +108,13 @@ class UserModel(db.Model, ModelInterface):
             first_name=self.first_name,
             last_name=self.last_name,
             mobile_phone=self.mobile_phone,
-            company_id=str(self.company_id),  
+            company_id=self.company_id,
             role=self.role,
             permission=self.permission,
             pass_hash=self.pass_hash,
             is_active=self.is_active,
-            salary=float(self.salary) if self.salary is not None else None,
-            work_capacity=float(self.work_capacity) if self.work_capacity is not None else None,
+            salary=self.salary,
+            work_capacity=self.work_capacity,
             employment_start=self.employment_start,
             employment_end=self.employment_end,
             weekend_choice=self.weekend_choice,
@@ -115,7 +129,7 @@ class TimeStampModel(db.Model, ModelInterface):
     punch type, timestamps, reporting type, details, and calculated total work time.
 
     Attributes:
-        uuid (UUID): Primary key, automatically generated UUID.
+        uuid (str): Primary key, automatically generated UUID, loaded as a string.
         user_email (str): Foreign key referencing `UserModel`.
         entered_by (str): Foreign key referencing `UserModel` (who entered the timestamp).
         punch_type (int): Type of punch (e.g., start work, start break).
@@ -123,13 +137,19 @@ class TimeStampModel(db.Model, ModelInterface):
         punch_out_timestamp (datetime): Timestamp for punch-out.
         reporting_type (str): Type of reporting (e.g., work, vacation).
         detail (str): Additional details about the timestamp.
-        total_work_time (int): Calculated total work time in seconds (hybrid property).
+        total_work_time (int): Total work time in seconds, computed by the database (column property).
         last_update (datetime): Timestamp of the last update to the record.
         entered_by_user (relationship): Relationship with `UserModel` for who entered the timestamp.
         user (relationship): Relationship with `UserModel` for the user the timestamp belongs to.
+
+    Indexes:
+        ix_ts_user_date: Composite index on (user_email, punch_in_timestamp) for per-user date range queries.
     """
     __tablename__ = 'time_stamps'
-    uuid = db.Column(UUID(as_uuid=True), primary_key=True, server_default=func.uuid_generate_v4())
+    __table_args__ = (
+        db.Index('ix_ts_user_date', 'user_email', 'punch_in_timestamp'),
+    )
+    uuid = db.Column(UUID(as_uuid=False), primary_key=True, server_default=func.uuid_generate_v4())
     user_email = db.Column(db.ForeignKey('users.email'),nullable=False)
     entered_by = db.Column(db.ForeignKey('users.email'), nullable=False)
     punch_type = db.Column(db.Integer)
@@ -137,7 +157,10 @@ class TimeStampModel(db.Model, ModelInterface):
     punch_out_timestamp = db.Column(db.DateTime(timezone=True))
     reporting_type = db.Column(db.String(32))
     detail = db.Column(db.String(255))
-    total_work_time = db.Column(db.Integer, nullable=True) 
+    # Computed by the database in the same SELECT; NULL while the timestamp has no punch out
+    total_work_time = column_property(
+        cast(func.trunc(func.extract('epoch', punch_out_timestamp - punch_in_timestamp)), Integer)
+    )
     last_update = db.Column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -147,27 +170,21 @@ class TimeStampModel(db.Model, ModelInterface):
     entered_by_user = db.relationship(
         'UserModel',
         foreign_keys=[entered_by],
-        backref='entered_timestamps'
+        back_populates='entered_timestamps',
+        lazy='raise'
     )
 
     user = db.relationship(
         'UserModel',
         foreign_keys=[user_email],
-        backref='timestamps'  
+        back_populates='timestamps',
+        lazy='raise'
     )
 
-    @hybrid_property
-    def total_work_time(self):
-        """Calculates the total work time in seconds between punch-in and punch-out timestamps."""
-        if self.punch_out_timestamp and self.punch_in_timestamp:
-            time_diff = self.punch_out_timestamp - self.punch_in_timestamp
-            return int(time_diff.total_seconds()) 
-        return None 
-
     def to_class(self):
         """Converts a `TimeStampModel` object to a `TimeStamp` domain object."""
         return TimeStamp(
-            uuid=str(self.uuid),
+            uuid=self.uuid,
             user_email=self.user_email,
             entered_by=self.entered_by,
             punch_type=self.punch_type,